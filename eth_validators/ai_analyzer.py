@@ -11,8 +11,8 @@ from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 import statistics
 from typing import Dict, List, Tuple, Any
-import yaml
 from pathlib import Path
+from .config import load_config
 
 def get_config_path():
     """Find config.yaml in current directory first, then in eth_validators directory"""
@@ -117,8 +117,7 @@ class ValidatorLogAnalyzer:
         """Analyze logs from all containers on a node for the specified time period."""
         try:
             # Load node configuration
-            with open(get_config_path(), 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_config(get_config_path())
             
             node_config = None
             for node in config.get('nodes', []):
@@ -560,8 +559,7 @@ def analyze_validator_performance_ai(node_name: str = None, hours: int = 24) ->
     else:
         # Analyze all nodes
         try:
-            with open(get_config_path(), 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_config(get_config_path())
             
             results = {}
             for node in config.get('nodes', []):
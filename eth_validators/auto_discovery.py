@@ -16,6 +16,8 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from .node_manager import _ssh_mux_options
+
 logger = logging.getLogger(__name__)
 
 class AutoConfigDiscovery:
@@ -62,17 +64,16 @@ class AutoConfigDiscovery:
         }
         
         try:
-            # 1. Discover Docker paths
-            discovery_result['docker_paths'] = self._discover_docker_paths(ssh_target)
-            
-            # 2. Get running containers
-            discovery_result['containers'] = self._get_containers(ssh_target)
+            # 1-2. Docker paths, running containers and responding API ports, in one round-trip
+            docker_paths, containers, responding_ports = self._probe_node(ssh_target)
+            discovery_result['docker_paths'] = docker_paths
+            discovery_result['containers'] = containers
             
             # 3. Discover active networks
             discovery_result['active_networks'] = self._discover_active_networks(discovery_result['containers'])
             
             # 4. Discover API ports
-            discovery_result['api_ports'] = self._discover_api_ports(ssh_target)
+            discovery_result['api_ports'] = self._discover_api_ports(responding_ports)
             
             # 5. Detect stacks in use
             discovery_result['detected_stacks'] = self._discover_stacks(discovery_result['containers'])
@@ -89,61 +90,83 @@ class AutoConfigDiscovery:
             
         return discovery_result
     
-    def _discover_docker_paths(self, ssh_target: Optional[str]) -> List[str]:
-        """Discover all eth-docker paths on the node"""
-        found_paths = []
+    def node_fingerprint(self, ssh_user: str, tailscale_domain: str) -> Optional[str]:
+        """
+        Cheap fingerprint of a node's running containers (a hash of their IDs)
         
-        for path in self.common_paths:
-            if self._path_exists(ssh_target, path):
-                found_paths.append(path)
-                logger.info(f"Found Docker path: {path}")
-                
-        return found_paths
-    
-    def _path_exists(self, ssh_target: Optional[str], path: str) -> bool:
-        """Check if a path exists on the node"""
+        Containers get new IDs whenever they are recreated, so an unchanged fingerprint
+        means a full discovery would find the same setup. Returns None if unreachable.
+        """
+        fingerprint_cmd = 'docker ps -q --no-trunc 2>/dev/null | sort | sha256sum'
+        if ssh_user != 'local':
+            cmd = ['ssh', '-o', 'BatchMode=yes', '-o', 'ConnectTimeout=10', *_ssh_mux_options().split(),
+                   f"{ssh_user}@{tailscale_domain}", fingerprint_cmd]
+        else:
+            cmd = ['sh', '-c', fingerprint_cmd]
         try:
-            if ssh_target:
-                cmd = f'ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} "test -d {path}"'
-            else:
-                cmd = f'test -d {path}'
-                
-            result = subprocess.run(cmd, shell=True, capture_output=True, timeout=15)
-            return result.returncode == 0
-        except:
-            return False
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+    
+    def _probe_script(self) -> str:
+        """Shell script that reports Docker paths, containers and API ports on one node"""
+        paths = ' '.join(self.common_paths)
+        ports = ' '.join(str(port) for port in self.common_ports)
+        return (
+            f'for p in {paths}; do [ -d "$p" ] && echo "PATH\t$p"; done\n'
+            "docker ps --format '{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}' 2>/dev/null | sed 's/^/CONTAINER\t/'\n"
+            # Probe the API ports side by side; each line is tagged, so order doesn't matter
+            f'for port in {ports}; do\n'
+            '  ( out=$(curl -s --connect-timeout 3 --max-time 5 "http://localhost:$port/eth/v1/node/version") '
+            '&& [ -n "$out" ] && echo "PORT\t$port" ) &\n'
+            'done\n'
+            'wait\n'
+        )
     
-    def _get_containers(self, ssh_target: Optional[str]) -> List[Dict]:
-        """Get all running Docker containers"""
+    def _probe_node(self, ssh_target: Optional[str]) -> Tuple[List[str], List[Dict], List[int]]:
+        """
+        Run every discovery probe in a single shell session on the node
+        
+        Returns:
+            Tuple of (existing Docker paths, running containers, responding API ports)
+        """
+        if ssh_target:
+            cmd = ['ssh', '-o', 'BatchMode=yes', '-o', 'ConnectTimeout=10', *_ssh_mux_options().split(), ssh_target, 'sh -s']
+        else:
+            cmd = ['sh', '-s']
         try:
-            if ssh_target:
-                cmd = f'ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} "docker ps --format \'{{{{.Names}}}}\t{{{{.Image}}}}\t{{{{.Status}}}}\t{{{{.Ports}}}}\'"'
-            else:
-                cmd = 'docker ps --format "{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"'
-                
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=20)
-            
-            if result.returncode != 0:
-                return []
-                
-            containers = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        containers.append({
-                            'name': parts[0],
-                            'image': parts[1], 
-                            'status': parts[2],
-                            'ports': parts[3] if len(parts) > 3 else ''
-                        })
-            
-            logger.info(f"Found {len(containers)} running containers")
-            return containers
-            
+            result = subprocess.run(cmd, input=self._probe_script(), capture_output=True, text=True, timeout=30)
+            output = result.stdout
         except Exception as e:
-            logger.error(f"Failed to get containers: {e}")
-            return []
+            logger.error(f"Failed to probe node: {e}")
+            output = ''
+        
+        found_paths, containers, ports = [], [], set()
+        for line in output.splitlines():
+            tag, _, rest = line.partition('\t')
+            if tag == 'PATH':
+                found_paths.append(rest)
+            elif tag == 'CONTAINER':
+                parts = rest.split('\t')
+                if len(parts) >= 3:
+                    containers.append({
+                        'name': parts[0],
+                        'image': parts[1], 
+                        'status': parts[2],
+                        'ports': parts[3] if len(parts) > 3 else ''
+                    })
+            elif tag == 'PORT' and rest.isdigit():
+                ports.add(int(rest))
+        
+        # Keep the configured order of candidates
+        found_paths = [path for path in self.common_paths if path in found_paths]
+        for path in found_paths:
+            logger.info(f"Found Docker path: {path}")
+        logger.info(f"Found {len(containers)} running containers")
+        return found_paths, containers, [port for port in self.common_ports if port in ports]
     
     def _discover_active_networks(self, containers: List[Dict]) -> Dict[str, Dict]:
         """Discover which networks are actively running"""
@@ -173,31 +196,17 @@ class AutoConfigDiscovery:
         logger.info(f"Discovered networks: {list(networks.keys())}")
         return networks
     
-    def _discover_api_ports(self, ssh_target: Optional[str]) -> Dict[str, int]:
-        """Discover active beacon API ports"""
+    def _discover_api_ports(self, responding_ports: List[int]) -> Dict[str, int]:
+        """Map the beacon API ports that responded to their networks"""
         api_ports = {}
         
-        for port in self.common_ports:
-            if self._port_responding(ssh_target, port):
-                network = self._identify_network_by_port(ssh_target, port)
-                api_ports[network] = port
-                logger.info(f"Found API port {port} for network {network}")
+        for port in responding_ports:
+            network = self._identify_network_by_port(None, port)
+            api_ports[network] = port
+            logger.info(f"Found API port {port} for network {network}")
         
         return api_ports
     
-    def _port_responding(self, ssh_target: Optional[str], port: int) -> bool:
-        """Check if a port is responding"""
-        try:
-            if ssh_target:
-                cmd = f'ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} "curl -s --connect-timeout 3 --max-time 5 http://localhost:{port}/eth/v1/node/version"'
-            else:
-                cmd = f'curl -s --connect-timeout 3 --max-time 5 http://localhost:{port}/eth/v1/node/version'
-                
-            result = subprocess.run(cmd, shell=True, capture_output=True, timeout=10)
-            return result.returncode == 0 and result.stdout.strip()
-        except:
-            return False
-    
     def _identify_network_by_port(self, ssh_target: Optional[str], port: int) -> str:
         """Identify which network a port belongs to"""
         # Common port mappings
@@ -1,19 +1,23 @@
 import click
-import yaml
 import subprocess
 import time
 import csv
 import json
 import random
 import os
+import sys
+import shutil
+import shlex
 from pathlib import Path
-from tabulate import tabulate
 import re
 from datetime import datetime
-from . import performance
-from .config import get_node_config, get_all_node_configs, get_config_path
-from .performance import get_performance_summary
+from collections import Counter, defaultdict
+from operator import itemgetter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from .config import get_node_config, get_all_node_configs, get_config_path, load_config, save_config
 from .node_manager import (
+    _ssh_mux_options,
     get_node_status,
     upgrade_node_docker_clients,
     get_system_update_status,
@@ -24,14 +28,11 @@ from .node_manager import (
     get_compose_p2p_ports,
     run_command_on_node,
 )
-from .ai_analyzer import ValidatorLogAnalyzer
-from .validator_sync import ValidatorSyncManager, get_active_validators_only
-from .validator_editor import InteractiveValidatorEditor
-from .validator_auto_discovery import ValidatorAutoDiscovery, auto_generate_validators_csv
-from .simple_setup import SimpleSetupWizard, quick_start_new_user, show_next_steps
 
 # Note: get_config_path is now imported from .config module (see import section above)
 # and supports multiple search locations including PROJECT_ROOT environment variable
+# tabulate and the discovery/setup modules are imported inside the commands that
+# use them so that `--help` and light commands don't pay for them at startup.
 
 def _run_command(node_cfg, command):
     """Run a command on a node, handling both local and remote execution"""
@@ -51,9 +52,10 @@ def _run_command(node_cfg, command):
             return MockResult()
     else:
         ssh_target = f"{node_cfg.get('ssh_user', 'root')}@{node_cfg['tailscale_domain']}"
-        ssh_command = f"ssh -o ConnectTimeout=10 -o BatchMode=yes {ssh_target} \"{command}\""
+        # argv form: no local /bin/sh, and the command reaches the remote shell verbatim
+        ssh_command = ['ssh', '-o', 'ConnectTimeout=10', '-o', 'BatchMode=yes', *_ssh_mux_options().split(), ssh_target, command]
         try:
-            result = subprocess.run(ssh_command, shell=True, capture_output=True, text=True, timeout=15)
+            result = subprocess.run(ssh_command, capture_output=True, text=True, timeout=15)
             return result
         except Exception as e:
             # Return a mock result object for consistency
@@ -64,33 +66,106 @@ def _run_command(node_cfg, command):
                     self.stderr = stderr
             return MockResult()
 
+# Status emoji and ANSI colour codes wrapped around node names in version tables
+_STATUS_DECOR_RE = re.compile(r'[🟢🔴]|\x1b\[[0-9;]*m')
+_STATUS_EMOJI_TABLE = str.maketrans('', '', '🟢🔴')
+# Network names appended to multi-network node rows as "<node>-<network>"
+_NETWORK_SUFFIXES = frozenset(('mainnet', 'testnet', 'hoodi', 'holesky', 'sepolia'))
+
+def _strip_status_decor(text):
+    """Remove status emoji (and ANSI colour codes, if any) from a node name cell"""
+    if '\x1b' in text:
+        return _STATUS_DECOR_RE.sub('', text).strip()
+    return text.translate(_STATUS_EMOJI_TABLE).strip()
+
+# ANSI codes for the version tables (same values colorama's Fore/Style would give us),
+# with the update-state cells and dimmed placeholders built once up front
+_RESET = '\x1b[0m'
+_DIM = '\x1b[90m'
+_UPDATE_STATE_COLORED = {
+    '🔄': f"\x1b[31m🔄{_RESET}",
+    '✅': f"\x1b[32m✅{_RESET}",
+    '❓': f"\x1b[33m❓{_RESET}",
+}
+_DIM_OFF = f"{_DIM}Off{_RESET}"
+_DIM_NO_CLIENTS = f"{_DIM}No clients{_RESET}"
+
+# Above this many rows, overview tables use tabulate's 'simple' format instead of 'fancy_grid'
+LARGE_CLUSTER_ROWS = 50
+
+
+def _table_format(rows):
+    """Box-drawn grid for normal tables, the cheaper 'simple' layout for large ones"""
+    return 'fancy_grid' if len(rows) <= LARGE_CLUSTER_ROWS else 'simple'
+
+# Upper bound on nodes worked on at once by the all-nodes commands (see --jobs)
+NODE_WORKERS = 32
+
+# Shared --jobs option for commands that fan out over nodes
+_jobs_option = click.option(
+    '--jobs', '-j', type=click.IntRange(min=1), default=NODE_WORKERS, show_default=True,
+    help='Nodes to work on at once. Lower it if an SSH jump host or bastion drops '
+         'connections (sshd MaxStartups defaults to 10 pending logins).')
+
+
+def _map_nodes(func, nodes, workers=NODE_WORKERS):
+    """
+    Yield func(node) for every node, in config order, while running the calls
+    on a thread pool - per-node work is almost all SSH/HTTP waiting.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(nodes)))) as pool:
+        yield from pool.map(func, nodes)
+
+# Running-container snapshots keyed by node name, shared by the detection helpers
+# below so a single command only runs `docker ps` once per node.
+_DOCKER_PS_SNAPSHOTS = {}
+
+def _docker_ps_snapshot(node_cfg):
+    """
+    Return the running containers on a node as a list of (name, image) tuples.
+
+    The result is memoized per node for the rest of the command; call
+    _clear_docker_ps_snapshots() after anything that restarts containers.
+    Returns None if docker ps could not be run.
+    """
+    key = node_cfg.get('name') or node_cfg.get('tailscale_domain')
+    if key in _DOCKER_PS_SNAPSHOTS:
+        return _DOCKER_PS_SNAPSHOTS[key]
+
+    result = _run_command(node_cfg, "docker ps --format '{{.Names}}\t{{.Image}}'")
+    if result.returncode != 0:
+        containers = None
+    else:
+        containers = []
+        for container_line in result.stdout.strip().split('\n'):
+            # Handle both tab and space separated output
+            if '\t' in container_line:
+                name, image = container_line.split('\t', 1)
+                containers.append((name.strip(), image.strip()))
+            else:
+                parts = container_line.split()
+                if len(parts) >= 2:
+                    containers.append((parts[0], parts[1]))
+
+    _DOCKER_PS_SNAPSHOTS[key] = containers
+    return containers
+
+def _clear_docker_ps_snapshots():
+    """Forget memoized docker ps snapshots, e.g. after an upgrade restarted containers"""
+    _DOCKER_PS_SNAPSHOTS.clear()
+    _CHARON_VERSIONS.clear()
+
 def _detect_running_stacks(node_cfg):
     """Detect all running stacks/services on a node by checking docker containers"""
     detected_stacks = []
     
     try:
         # Get all running containers
-        command = "docker ps --format 'table {{.Names}}\t{{.Image}}' | tail -n +2"
-        result = _run_command(node_cfg, command)
-        
-        if result.returncode != 0 or not result.stdout.strip():
+        containers = _docker_ps_snapshot(node_cfg)
+        if not containers:
             return ["unknown"]
         
-        containers = result.stdout.strip().split('\n')
-        container_info = []
-        
-        for container_line in containers:
-            # Handle both tab and space separated output
-            if '\t' in container_line:
-                name, image = container_line.split('\t', 1)
-                container_info.append({'name': name.strip(), 'image': image.strip()})
-            else:
-                # Handle space-separated format
-                parts = container_line.split()
-                if len(parts) >= 2:
-                    name = parts[0]
-                    image = parts[1]
-                    container_info.append({'name': name, 'image': image})
+        container_info = [{'name': name, 'image': image} for name, image in containers]
         
         # Detect different stacks based on container patterns
         stack_indicators = {
@@ -157,22 +232,35 @@ def _detect_running_stacks(node_cfg):
     except Exception as e:
         return ["error"]
 
+# Charon versions keyed like _DOCKER_PS_SNAPSHOTS and cleared along with them;
+# several detection helpers ask for the same node's version in one command.
+_CHARON_VERSIONS = {}
+
 def _get_charon_version(ssh_target, tailscale_domain, node_cfg=None):
     """Get Charon version if it's running on the node"""
+    if node_cfg is None:
+        node_cfg = {'ssh_user': ssh_target.split('@', 1)[0], 'tailscale_domain': tailscale_domain}
+    key = node_cfg.get('name') or node_cfg.get('tailscale_domain')
+    if key not in _CHARON_VERSIONS:
+        _CHARON_VERSIONS[key] = _probe_charon_version(node_cfg)
+    return _CHARON_VERSIONS[key]
+
+def _probe_charon_version(node_cfg):
+    """Run the docker queries behind _get_charon_version"""
     try:
-        # First try to get the actual running version by executing charon version
-        command = "docker ps --format 'table {{.Names}}' | grep charon | grep -v lodestar | head -1"
-        result = _run_command(node_cfg, command) if node_cfg else subprocess.run(f"ssh -o ConnectTimeout=10 -o BatchMode=yes {ssh_target} \"{command}\"", shell=True, capture_output=True, text=True, timeout=15)
-        
-        if result.returncode == 0 and result.stdout.strip():
-            container_name = result.stdout.strip()
-            
-            # Try to get actual version from the running container
-            version_command = f"docker exec {container_name} charon version 2>/dev/null | head -1 | awk '{{print $1}}' || echo 'exec_failed'"
-            version_result = _run_command(node_cfg, version_command) if node_cfg else subprocess.run(f"ssh -o ConnectTimeout=10 -o BatchMode=yes {ssh_target} \"{version_command}\"", shell=True, capture_output=True, text=True, timeout=10)
-            
-            if version_result.returncode == 0 and version_result.stdout.strip() and version_result.stdout.strip() != "exec_failed":
-                version = version_result.stdout.strip()
+        containers = _docker_ps_snapshot(node_cfg) or []
+        charon_containers = [(name, image) for name, image in containers if 'charon' in f"{name}\t{image}"]
+        container_name = next((name for name, _ in charon_containers if 'charon' in name and 'lodestar' not in name), None)
+        
+        if container_name:
+            # First try to get the actual running version by executing charon version
+            version_result = _run_command(node_cfg, f"docker exec {container_name} charon version 2>/dev/null")
+            # Only the first word of the first line is the version; pick it out here
+            # rather than piping through head/awk on the node
+            version_words = version_result.stdout.split(None, 1)
+            
+            if version_result.returncode == 0 and version_words:
+                version = version_words[0]
                 # Clean up version string (remove 'v' prefix if present and extract just the version number)
                 if version.startswith('v'):
                     version = version[1:]
@@ -184,16 +272,12 @@ def _get_charon_version(ssh_target, tailscale_domain, node_cfg=None):
                 return version
             
             # Fallback: get version from image tag
-            image_command = "docker ps --format 'table {{.Names}}\\t{{.Image}}' | grep charon | head -1 | awk '{print $2}'"
-            image_result = _run_command(node_cfg, image_command) if node_cfg else subprocess.run(f"ssh -o ConnectTimeout=10 -o BatchMode=yes {ssh_target} \"{image_command}\"", shell=True, capture_output=True, text=True, timeout=10)
-            
-            if image_result.returncode == 0 and image_result.stdout.strip():
-                image = image_result.stdout.strip()
-                if ':' in image:
-                    version = image.split(':')[-1]
-                    return version
-                else:
-                    return "latest"
+            image = charon_containers[0][1]
+            if ':' in image:
+                version = image.split(':')[-1]
+                return version
+            else:
+                return "latest"
         
         return "N/A"
     except (subprocess.TimeoutExpired, Exception):
@@ -201,16 +285,12 @@ def _get_charon_version(ssh_target, tailscale_domain, node_cfg=None):
 
 def _get_latest_charon_version():
     """Get the latest Charon version from GitHub releases"""
-    try:
-        import requests
-        url = "https://api.github.com/repos/ObolNetwork/charon/releases/latest"
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('tag_name', 'Unknown').lstrip('v')
-        return "Unknown"
-    except Exception:
+    # Shares the release cache (and its rate-limit fallback) with the client version checks
+    from .node_manager import _get_latest_github_release
+    version = _get_latest_github_release('charon')
+    if version in ("Rate Limited", "API Error", "Network Error") or not version:
         return "Unknown"
+    return version
 
 def _is_stack_disabled(stack):
     """Check if stack is disabled - supports both string and list format"""
@@ -243,6 +323,10 @@ def _is_charon_only_node(node_cfg):
         return charon_version != "N/A"
     return False
 
+# Matched against "name<TAB>image" lines from the docker ps snapshot
+_LODESTAR_VALIDATOR_RE = re.compile(r'lodestar.*validator|lodestar.*latest')
+_VERO_VALIDATOR_RE = re.compile(r'validator.*vero|vero.*validator|eth-docker-validator')
+
 def _get_validator_only_clients(node_cfg):
     """
     For nodes without execution/consensus clients, detect what validator clients are running.
@@ -260,29 +344,23 @@ def _get_validator_only_clients(node_cfg):
         if charon_version != "N/A":
             validator_clients.append(f"charon/{charon_version}")
         
-        # Check for Lodestar validator
-        command = "docker ps --format 'table {{.Names}}\\t{{.Image}}' | grep -E 'lodestar.*validator|lodestar.*latest' | head -1"
-        result = _run_command(node_cfg, command)
+        containers = _docker_ps_snapshot(node_cfg) or []
         
-        if result.returncode == 0 and result.stdout.strip():
+        # Check for Lodestar validator
+        lodestar = next(((name, image) for name, image in containers
+                         if _LODESTAR_VALIDATOR_RE.search(f"{name}\t{image}")), None)
+        if lodestar:
             # Get Lodestar version
-            container_line = result.stdout.strip()
-            if 'lodestar' in container_line.lower():
-                image_part = container_line.split('\t')[-1] if '\t' in container_line else container_line.split()[-1]
-                if ':' in image_part:
-                    version = image_part.split(':')[-1]
-                    validator_clients.append(f"lodestar/{version}")
-                else:
-                    validator_clients.append("lodestar/latest")
+            image_part = lodestar[1]
+            if ':' in image_part:
+                version = image_part.split(':')[-1]
+                validator_clients.append(f"lodestar/{version}")
+            else:
+                validator_clients.append("lodestar/latest")
         
         # Check for Vero validator
-        command = "docker ps --format 'table {{.Names}}\\t{{.Image}}' | grep -E 'vero|validator.*vero' | head -1"
-        result = _run_command(node_cfg, command)
-        
-        if result.returncode == 0 and result.stdout.strip():
-            container_line = result.stdout.strip()
-            if 'vero' in container_line.lower():
-                validator_clients.append("vero/local")
+        if any('vero' in f"{name}\t{image}" for name, image in containers):
+            validator_clients.append("vero/local")
         
         return {
             'validator_clients': validator_clients,
@@ -309,13 +387,10 @@ def _detect_additional_validators(node_cfg):
         stack = node_cfg.get('stack', [])
         if 'lido-csm' in stack:
             # Verify by checking for actual Vero containers
-            command = "docker ps --format 'table {{.Names}}\\t{{.Image}}' | grep -E 'validator.*vero|vero.*validator|eth-docker-validator'"
-            result = _run_command(node_cfg, command)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                container_line = result.stdout.strip()
-                if 'vero' in container_line.lower():
-                    additional_validators.append("vero")
+            if any('vero' in line.lower()
+                   for line in (f"{name}\t{image}" for name, image in _docker_ps_snapshot(node_cfg) or [])
+                   if _VERO_VALIDATOR_RE.search(line)):
+                additional_validators.append("vero")
         
         # Additional checks for other validator clients can be added here
         # For example, checking for Stakewise validators, etc.
@@ -360,9 +435,12 @@ def config_group():
 @click.argument('node', required=False)
 @click.option('--all', is_flag=True, help='Check system updates for all configured nodes')
 @click.option('--reboot', is_flag=True, help='Automatically reboot nodes if required after upgrade')
-def system_update(node, all, reboot):
+@_jobs_option
+def system_update(node, all, reboot, jobs):
     """Check for available Ubuntu system updates and optionally upgrade."""
-    config = yaml.safe_load(get_config_path().read_text())
+    from tabulate import tabulate
+
+    config = load_config()
     
     if all and node:
         click.echo("❌ Cannot specify both --all and a node name")
@@ -375,10 +453,7 @@ def system_update(node, all, reboot):
     if all:
         nodes_to_check = config.get('nodes', [])
     else:
-        node_cfg = next(
-            (n for n in config['nodes'] if n.get('tailscale_domain') == node or n.get('name') == node),
-            None
-        )
+        node_cfg = get_node_config(node)
         if not node_cfg:
             click.echo(f"❌ Node {node} not found")
             return
@@ -391,30 +466,44 @@ def system_update(node, all, reboot):
     nodes_needing_reboot = []
     processed_reboot_nodes = set()
     
-    for i, node_cfg in enumerate(nodes_to_check):
+    def check_node(node_cfg):
+        # Skip disabled nodes but still show them, UNLESS they have validator-only clients
+        if _is_stack_disabled(node_cfg.get('stack', ['eth-docker'])):
+            validator_info = _get_validator_only_clients(node_cfg)
+            if not (validator_info and validator_info['has_clients']):
+                return None
+        try:
+            status = get_system_update_status(node_cfg)
+            # The update check normally reports reboot-required too, saving another round trip
+            if 'reboot_required' in status:
+                return status, "🔄 Yes" if status['reboot_required'] else "✅ No"
+            is_local = node_cfg.get('is_local', False)
+            return status, _check_reboot_needed(node_cfg.get('ssh_user', 'root'), node_cfg['tailscale_domain'], is_local)
+        except Exception as e:
+            return e
+    
+    # Nodes are checked concurrently; results come back in config order
+    checks = _map_nodes(check_node, nodes_to_check, jobs)
+    for i, (node_cfg, checked) in enumerate(zip(nodes_to_check, checks)):
         name = node_cfg['name']
-        stack = node_cfg.get('stack', ['eth-docker'])
         
         if all:
             click.echo(f"📡 Checking {name}... ({i+1}/{len(nodes_to_check)})", nl=False, err=True)
         
-        # Skip disabled nodes but still show them, UNLESS they have validator-only clients
-        if _is_stack_disabled(stack):
-            validator_info = _get_validator_only_clients(node_cfg)
-            if not (validator_info and validator_info['has_clients']):
-                if all:
-                    table_data.append([f"🔴 {name}", "Disabled", "-", "-"])
-                    click.echo(" ✓", err=True)
-                else:
-                    click.echo(f"⚪ Node {name} is disabled")
-                continue
+        if checked is None:
+            if all:
+                table_data.append([f"🔴 {name}", "Disabled", "-", "-"])
+                click.echo(" ✓", err=True)
+            else:
+                click.echo(f"⚪ Node {name} is disabled")
+            continue
         
         try:
-            status = get_system_update_status(node_cfg)
+            if isinstance(checked, Exception):
+                raise checked
+            status, reboot_needed_before = checked
             updates_available = status.get('updates_available', 'Error')
             needs_update = status.get('needs_system_update', False)
-            is_local = node_cfg.get('is_local', False)
-            reboot_needed_before = _check_reboot_needed(node_cfg.get('ssh_user', 'root'), node_cfg['tailscale_domain'], is_local)
             
             if needs_update:
                 nodes_needing_update.append(node_cfg)
@@ -470,7 +559,6 @@ def system_update(node, all, reboot):
         click.echo(f"\n⚠️  Nodes needing system updates: {', '.join(node_names)}")
         
         # Use explicit input handling for better reliability
-        import sys
         if sys.stdin.isatty():
             while True:
                 try:
@@ -503,17 +591,31 @@ def system_update(node, all, reboot):
         if should_upgrade:
             click.echo("🔄 Upgrading system packages...")
             upgrade_results = []
-            for i, node_cfg in enumerate(nodes_needing_update):
+            
+            def upgrade_node(node_cfg):
+                try:
+                    result = perform_system_upgrade(node_cfg)
+                    reboot_status = None
+                    if result.get('upgrade_success', False):
+                        is_local = node_cfg.get('is_local', False)
+                        reboot_status = _check_reboot_needed(node_cfg.get('ssh_user', 'root'), node_cfg['tailscale_domain'], is_local)
+                    return result, reboot_status
+                except Exception as e:
+                    return e
+            
+            # Upgrades run concurrently; reboots are then handled node by node in config order
+            upgrades = _map_nodes(upgrade_node, nodes_needing_update, jobs)
+            for i, (node_cfg, upgraded) in enumerate(zip(nodes_needing_update, upgrades)):
                 name = node_cfg['name']
                 click.echo(f"\n🔄 Upgrading {name}... ({i+1}/{len(nodes_needing_update)})")
                 try:
-                    result = perform_system_upgrade(node_cfg)
+                    if isinstance(upgraded, Exception):
+                        raise upgraded
+                    result, reboot_status = upgraded
                     if result.get('upgrade_success', False):
                         click.echo(f"✅ {name} system upgrade completed successfully")
                         upgrade_results.append((name, True, None))
                         
-                        is_local = node_cfg.get('is_local', False)
-                        reboot_status = _check_reboot_needed(node_cfg.get('ssh_user', 'root'), node_cfg['tailscale_domain'], is_local)
                         if "Yes" in reboot_status:
                             if reboot:
                                 click.echo(f"🔄 Rebooting {name}...")
@@ -574,7 +676,6 @@ def system_update(node, all, reboot):
 
     remaining_reboot_nodes = [n for n in nodes_needing_reboot if n['name'] not in processed_reboot_nodes]
     if remaining_reboot_nodes:
-        import sys
         if sys.stdin.isatty():
             for node_cfg in remaining_reboot_nodes:
                 name = node_cfg['name']
@@ -619,6 +720,7 @@ def validator_group():
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed discovery progress')
 def validator_discover(output, config, verbose):
     """🔍 Auto-discover validators across all nodes and generate simplified CSV"""
+    from .validator_auto_discovery import ValidatorAutoDiscovery
     
     if verbose:
         import logging
@@ -631,26 +733,20 @@ def validator_discover(output, config, verbose):
         discovery = ValidatorAutoDiscovery(config)
         csv_path = discovery.generate_validators_csv(output)
         
-        # Read and display summary
+        # Read and display summary; the counts are tallied while streaming the CSV
+        node_counts = Counter()
+        protocol_counts = Counter()
         with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            validators = list(reader)
+            for validator in csv.DictReader(csvfile):
+                node_counts[validator['node_name']] += 1
+                protocol_counts[validator['protocol']] += 1
+        total_validators = sum(node_counts.values())
         
-        if validators:
-            click.echo(f"\n🎉 SUCCESS! Discovered {len(validators)} validators!")
+        if total_validators:
+            click.echo(f"\n🎉 SUCCESS! Discovered {total_validators} validators!")
             click.echo(f"📄 CSV saved to: {csv_path}")
             
             # Show summary by node
-            node_counts = {}
-            protocol_counts = {}
-            
-            for validator in validators:
-                node = validator['node_name']
-                protocol = validator['protocol']
-                
-                node_counts[node] = node_counts.get(node, 0) + 1
-                protocol_counts[protocol] = protocol_counts.get(protocol, 0) + 1
-            
             click.echo("\n📊 Discovery Summary:")
             click.echo("💻 By Node:")
             for node, count in node_counts.items():
@@ -697,6 +793,8 @@ def validator_discover(output, config, verbose):
 @cli.command(name='quickstart')
 def quickstart():
     """🚀 Interactive setup for new users - get started in minutes!"""
+    from .simple_setup import quick_start_new_user, show_next_steps
+
     try:
         click.echo("🚀 Ethereum Validator Cluster Manager - Quick Start")
         click.echo("=" * 55)
@@ -705,7 +803,13 @@ def quickstart():
         config_path = Path('config.yaml')
         if config_path.exists():
             if click.confirm("config.yaml already exists. Overwrite with new setup?"):
-                config_path.rename(f"config.yaml.backup_{int(time.time())}")
+                # Hardlink keeps config.yaml in place while the wizard runs;
+                # the wizard replaces the file rather than truncating it.
+                backup_path = f"config.yaml.backup_{int(time.time())}"
+                try:
+                    os.link(config_path, backup_path)
+                except OSError:
+                    shutil.copy2(config_path, backup_path)
             else:
                 click.echo("Setup cancelled. Your existing configuration is preserved.")
                 return
@@ -724,16 +828,15 @@ def quickstart():
 
 def _check_reboot_needed(ssh_user, tailscale_domain, is_local=False):
     """Check if a node needs a reboot by checking for reboot-required file"""
+    if is_local:
+        # For local nodes, check the file directly instead of spawning a shell
+        return "🔄 Yes" if os.path.exists('/var/run/reboot-required') else "✅ No"
     try:
-        if is_local:
-            # For local nodes, run the command directly
-            cmd = 'test -f /var/run/reboot-required && echo REBOOT_NEEDED || echo NO_REBOOT'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
-        else:
-            # For remote nodes, use SSH
-            ssh_target = f"{ssh_user}@{tailscale_domain}"
-            cmd = f"ssh -o ConnectTimeout=5 -o BatchMode=yes {ssh_target} 'test -f /var/run/reboot-required && echo REBOOT_NEEDED || echo NO_REBOOT'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
+        # For remote nodes, use SSH
+        ssh_target = f"{ssh_user}@{tailscale_domain}"
+        cmd = ['ssh', '-o', 'ConnectTimeout=5', '-o', 'BatchMode=yes', *_ssh_mux_options().split(), ssh_target,
+               'test -f /var/run/reboot-required && echo REBOOT_NEEDED || echo NO_REBOOT']
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0:
             if "REBOOT_NEEDED" in result.stdout:
@@ -751,24 +854,127 @@ def _initiate_reboot(node_cfg):
         is_local = node_cfg.get('is_local', False)
         ssh_user = node_cfg.get('ssh_user', 'root')
 
-        if is_local:
-            reboot_cmd = 'reboot' if ssh_user == 'root' else 'sudo reboot'
-        else:
+        # argv lists throughout, so no local shell is started
+        reboot_cmd = ['reboot'] if ssh_user == 'root' else ['sudo', 'reboot']
+        if not is_local:
             ssh_target = f"{ssh_user}@{node_cfg['tailscale_domain']}"
-            if ssh_user == 'root':
-                reboot_cmd = f"ssh -o ConnectTimeout=10 -o BatchMode=yes {ssh_target} 'reboot'"
-            else:
-                reboot_cmd = f"ssh -o ConnectTimeout=10 -o BatchMode=yes {ssh_target} 'sudo reboot'"
+            reboot_cmd = ['ssh', '-o', 'ConnectTimeout=10', '-o', 'BatchMode=yes', *_ssh_mux_options().split(),
+                          ssh_target, ' '.join(reboot_cmd)]
 
-        result = subprocess.run(reboot_cmd, shell=True, timeout=20)
+        result = subprocess.run(reboot_cmd, timeout=20)
         return result.returncode == 0
     except Exception:
         return False
 
+# Emoji shown before each stack name in the cluster overview
+_STACK_EMOJIS = {
+    'eth-docker': '🐳', 'disabled': '🚫', 'rocketpool': '🚀', 'obol': '🔗',
+    'hyperdrive': '⚡', 'charon': '🌐', 'ssv': '📡', 'stakewise': '🏦',
+    'lido-csm': '🏦', 'eth-hoodi': '🧪', 'nethermind': '⚙️', 'besu': '⚙️',
+    'geth': '⚙️', 'reth': '⚙️', 'lighthouse': '🔗', 'teku': '🔗',
+    'nimbus': '🔗', 'lodestar': '🔗', 'prysm': '🔗', 'vero': '🔗'
+}
+
+# Detected stacks that replace the configured one in the overview (client names don't)
+_MAIN_STACKS = frozenset(('eth-docker', 'rocketpool', 'obol', 'charon', 'hyperdrive', 'ssv', 'lido-csm', 'stakewise'))
+
+@lru_cache(maxsize=128)
+def _format_stack_display(stacks):
+    """Render a tuple of stack names as '🐳 eth-docker + 🏦 lido-csm'; most nodes share a few stacks"""
+    return " + ".join([f"{_STACK_EMOJIS.get(s.lower(), '⚙️')} {s}" for s in stacks])
+
+def _categorize_node(node):
+    """
+    Work out everything the cluster overview shows for one node in a single pass.
+
+    Returns a dict with the row fields ('status_emoji', 'status_text', 'clients',
+    'stack_display'), the live 'exec_client'/'consensus_client' names used for the
+    diversity summary (None when the node runs no EL/CL clients), 'active' and the
+    stderr 'progress' suffix for the "Processing..." line.
+    """
+    stack = node.get('stack', ['eth-docker'])
+
+    # Stack info with emojis - use live detection when possible
+    # Fallback to configured stack unless live detection finds a known main stack.
+    # Nodes configured as disabled skip the docker ps round-trip entirely.
+    stack_disabled = _is_stack_disabled(stack)
+    stack_display = "🚫 disabled" if stack_disabled else _format_stack_display(tuple(stack))
+    if not stack_disabled:
+        try:
+            detected_stacks = _detect_running_stacks(node)
+            if detected_stacks and detected_stacks != ["unknown"] and detected_stacks != ["error"]:
+                main_stacks = [s for s in detected_stacks if s in _MAIN_STACKS]
+                if main_stacks:
+                    stack_display = _format_stack_display(tuple(main_stacks))
+        except Exception:
+            pass
+
+    result = {
+        'stack_display': stack_display,
+        'exec_client': None,
+        'consensus_client': None,
+        'progress': " ✓",
+    }
+
+    if stack_disabled or not _has_ethereum_clients(node):
+        # Check if this is a validator-only node (like Charon + validator clients)
+        validator_info = _get_validator_only_clients(node)
+        if validator_info and validator_info['has_clients']:
+            result.update(status_emoji="🟢", status_text="Active", active=True,
+                          clients=f"🔗 {validator_info['display_name']}")
+            # Override stack display if Charon is detected
+            if 'charon' in validator_info.get('display_name', '').lower():
+                result['stack_display'] = "🔗 obol"
+        else:
+            result.update(status_emoji="🔴", status_text="Disabled", active=False,
+                          clients="❌ No clients")
+        return result
+
+    # Use live client detection instead of static config
+    try:
+        version_info = get_docker_client_versions(node)
+
+        # Handle multi-network nodes (like eliedesk)
+        if 'mainnet' in version_info or 'testnet' in version_info:
+            # Multi-network node: aggregate unique clients from active networks only
+            exec_names = set()
+            cons_names = set()
+            for net_info in version_info.values():
+                if isinstance(net_info, dict) and 'error' not in net_info:
+                    exec_client = net_info.get('execution_client', 'Unknown')
+                    cons_client = net_info.get('consensus_client', 'Unknown')
+                    if exec_client not in ['Unknown', 'Error']:
+                        exec_names.add(exec_client)
+                    if cons_client not in ['Unknown', 'Error']:
+                        cons_names.add(cons_client)
+
+            exec_client = ', '.join(sorted(exec_names)) if exec_names else "N/A"
+            consensus_client = ', '.join(sorted(cons_names)) if cons_names else "N/A"
+        else:
+            # Single network node
+            exec_client = version_info.get('execution_client', 'N/A')
+            consensus_client = version_info.get('consensus_client', 'N/A')
+    except Exception as e:
+        # If live detection fails, show error status
+        exec_client = 'Error'
+        consensus_client = 'Error'
+        result['progress'] = f" ❌ Error: {str(e)[:30]}..."
+
+    # Check for additional validators like Vero
+    additional_validators = _detect_additional_validators(node)
+    validator_suffix = f" + 🔒 {', '.join(additional_validators)}" if additional_validators else ""
+
+    result.update(status_emoji="🟢", status_text="Active", active=True,
+                  clients=f"⚙️  {exec_client} + 🔗 {consensus_client}{validator_suffix}",
+                  exec_client=exec_client, consensus_client=consensus_client)
+    return result
+
 @node_group.command(name='list')
 def list_cmd():
     """Display a live cluster overview with real-time client diversity analysis."""
-    config = yaml.safe_load(get_config_path().read_text())
+    from tabulate import tabulate
+
+    config = load_config()
     nodes = config.get('nodes', [])
     
     if not nodes:
@@ -783,154 +989,42 @@ def list_cmd():
     active_nodes = 0
     disabled_nodes = 0
     
-    exec_clients = {}
-    consensus_clients = {}
+    exec_clients = Counter()
+    consensus_clients = Counter()
+    untracked = ('Unknown', 'Error', 'N/A')
+    total = len(nodes)
     
-    for i, node in enumerate(nodes):
+    # Nodes are probed concurrently; results still come back in config order
+    for i, (node, info) in enumerate(zip(nodes, _map_nodes(_categorize_node, nodes))):
         name = node['name']
-        stack = node.get('stack', ['eth-docker'])
-        
-        click.echo(f"📡 Processing {name}... ({i+1}/{len(nodes)})", nl=False, err=True)
-        
-        # Stack info with emojis - use live detection when possible
-        stack_emojis = {
-            'eth-docker': '🐳', 'disabled': '🚫', 'rocketpool': '🚀', 'obol': '🔗',
-            'hyperdrive': '⚡', 'charon': '🌐', 'ssv': '📡', 'stakewise': '🏦',
-            'lido-csm': '🏦', 'eth-hoodi': '🧪', 'nethermind': '⚙️', 'besu': '⚙️',
-            'geth': '⚙️', 'reth': '⚙️', 'lighthouse': '🔗', 'teku': '🔗',
-            'nimbus': '🔗', 'lodestar': '🔗', 'prysm': '🔗', 'vero': '🔗'
-        }
+        click.echo(f"📡 Processing {name}... ({i+1}/{total})", nl=False, err=True)
+        click.echo(info['progress'], err=True)
         
-        # Try to detect running stacks live
-        try:
-            detected_stacks = _detect_running_stacks(node)
-            if detected_stacks and detected_stacks != ["unknown"] and detected_stacks != ["error"]:
-                # Use detected stacks instead of config
-                main_stacks = []
-                client_stacks = []
-                
-                for s in detected_stacks:
-                    if s in ['eth-docker', 'rocketpool', 'obol', 'charon', 'hyperdrive', 'ssv', 'lido-csm', 'stakewise']:
-                        main_stacks.append(s)
-                    elif s in ['nethermind', 'besu', 'geth', 'reth', 'lighthouse', 'teku', 'nimbus', 'lodestar', 'prysm', 'vero']:
-                        client_stacks.append(s)
-                
-                if main_stacks:
-                    stack_parts = [f"{stack_emojis.get(s.lower(), '⚙️')} {s}" for s in main_stacks]
-                    stack_display = " + ".join(stack_parts)
-                else:
-                    # Fallback to configured stack
-                    if 'disabled' in stack:
-                        stack_display = "🚫 disabled"
-                    else:
-                        stack_parts = [f"{stack_emojis.get(s.lower(), '⚙️')} {s}" for s in stack]
-                        stack_display = " + ".join(stack_parts)
-                
-                # Store detected clients for diversity calculation
-                detected_clients = {'execution': [], 'consensus': []}
-                for client in client_stacks:
-                    if client in ['nethermind', 'besu', 'geth', 'reth']:
-                        detected_clients['execution'].append(client)
-                    elif client in ['lighthouse', 'teku', 'nimbus', 'lodestar', 'prysm']:
-                        detected_clients['consensus'].append(client)
-            else:
-                # Fallback to configured stack
-                if 'disabled' in stack:
-                    stack_display = "🚫 disabled"
-                else:
-                    stack_parts = [f"{stack_emojis.get(s.lower(), '⚙️')} {s}" for s in stack]
-                    stack_display = " + ".join(stack_parts)
-                detected_clients = None
-        except:
-            # Fallback to configured stack on error
-            if 'disabled' in stack:
-                stack_display = "🚫 disabled"
-            else:
-                stack_parts = [f"{stack_emojis.get(s.lower(), '⚙️')} {s}" for s in stack]
-                stack_display = " + ".join(stack_parts)
-            detected_clients = None
-
-        if _is_stack_disabled(stack) or not _has_ethereum_clients(node):
-            # Check if this is a validator-only node (like Charon + validator clients)
-            validator_info = _get_validator_only_clients(node)
-            if validator_info and validator_info['has_clients']:
-                status_emoji = "🟢"
-                status_text = "Active"
-                active_nodes += 1
-                clients = f"🔗 {validator_info['display_name']}"
-                
-                # Override stack display if Charon is detected
-                if 'charon' in validator_info.get('display_name', '').lower():
-                    stack_display = "🔗 obol"
-                    
-                click.echo(" ✓", err=True)
-            else:
-                status_emoji = "🔴"
-                status_text = "Disabled"
-                clients = "❌ No clients"
-                disabled_nodes += 1
-                click.echo(" ✓", err=True)
-        else:
-            status_emoji = "🟢"
-            status_text = "Active"
+        if info['active']:
             active_nodes += 1
-            
-            # Use live client detection instead of static config
-            try:
-                version_info = get_docker_client_versions(node)
-                
-                # Handle multi-network nodes (like eliedesk)
-                if 'mainnet' in version_info or 'testnet' in version_info:
-                    # Multi-network node: aggregate unique clients from active networks only
-                    exec_names = set()
-                    cons_names = set()
-                    for net_info in version_info.values():
-                        if isinstance(net_info, dict) and 'error' not in net_info:
-                            exec_client = net_info.get('execution_client', 'Unknown')
-                            cons_client = net_info.get('consensus_client', 'Unknown')
-                            if exec_client not in ['Unknown', 'Error']:
-                                exec_names.add(exec_client)
-                            if cons_client not in ['Unknown', 'Error']:
-                                cons_names.add(cons_client)
-                    
-                    exec_client = ', '.join(sorted(exec_names)) if exec_names else "N/A"
-                    consensus_client = ', '.join(sorted(cons_names)) if cons_names else "N/A"
-                else:
-                    # Single network node
-                    exec_client = version_info.get('execution_client', 'N/A')
-                    consensus_client = version_info.get('consensus_client', 'N/A')
-
-                click.echo(" ✓", err=True)
-            except Exception as e:
-                # If live detection fails, show error status
-                exec_client = 'Error'
-                consensus_client = 'Error'
-                click.echo(f" ❌ Error: {str(e)[:30]}...", err=True)
-
-            # Track diversity
-            if exec_client and exec_client not in ['Unknown', 'Error', 'N/A']:
-                exec_clients[exec_client] = exec_clients.get(exec_client, 0) + 1
-            if consensus_client and consensus_client not in ['Unknown', 'Error', 'N/A']:
-                consensus_clients[consensus_client] = consensus_clients.get(consensus_client, 0) + 1
-            
-            # Check for additional validators like Vero
-            additional_validators = _detect_additional_validators(node)
-            validator_suffix = ""
-            if additional_validators:
-                validator_suffix = f" + 🔒 {', '.join(additional_validators)}"
-            
-            clients = f"⚙️  {exec_client} + 🔗 {consensus_client}{validator_suffix}"
+        else:
+            disabled_nodes += 1
+        
+        # Track diversity
+        exec_client = info['exec_client']
+        consensus_client = info['consensus_client']
+        if exec_client and exec_client not in untracked:
+            exec_clients[exec_client] += 1
+        if consensus_client and consensus_client not in untracked:
+            consensus_clients[consensus_client] += 1
 
         table_data.append([
-            f"{status_emoji} {name}",
-            status_text,
-            clients,
-            stack_display
+            f"{info['status_emoji']} {name}",
+            info['status_text'],
+            info['clients'],
+            info['stack_display']
         ])
 
     click.echo("\nRendering table...")
     headers = ['Node Name', 'Status', 'Live Ethereum Clients', 'Stack']
-    click.echo(tabulate(table_data, headers=headers, tablefmt='fancy_grid'))
+    # Every cell is display text, so skip tabulate's per-cell number parsing; drop the
+    # box drawing for big clusters where fancy_grid doubles the rendered line count.
+    click.echo(tabulate(table_data, headers=headers, tablefmt=_table_format(table_data), disable_numparse=True))
     
     click.echo(f"\n📊 CLUSTER SUMMARY:")
     click.echo(f"  🟢 Active nodes: {active_nodes}")
@@ -961,6 +1055,54 @@ def list_cmd():
     click.echo(f"\n💡 Use 'node versions --all' for detailed version and update status.")
     click.echo("=" * 100)
 
+def _upgrade_node_report(node_cfg, name):
+    """
+    Upgrade a node's Docker clients and return (ok, report), report being the text
+    `node upgrade` prints for it. Kept free of output so it can run in a worker thread.
+    """
+    # Use the enhanced upgrade function that supports multi-network
+    result = upgrade_node_docker_clients(node_cfg)
+    ok = result.get('overall_success', result.get('upgrade_success', False))
+    return ok, _format_upgrade_result(name, result)
+
+def _format_upgrade_result(name, result):
+    """
+    Render the outcome of upgrade_node_docker_clients for one node as a single block of
+    text, so each node's report is written in one go instead of line by line.
+    """
+    lines = []
+    # Check if this is a multi-network result
+    if 'overall_success' in result:
+        # Multi-network node
+        if result['overall_success']:
+            lines.append(f"✅ {name} upgrade completed successfully for all networks")
+        else:
+            lines.append(f"❌ {name} upgrade had some failures")
+        
+        # Show details for each network
+        for network_name, network_result in result.items():
+            if network_name == 'overall_success':
+                continue
+            
+            if network_result['upgrade_success']:
+                lines.append(f"  ✅ {network_name}: Success")
+            else:
+                lines.append(f"  ❌ {network_name}: Failed")
+                if network_result.get('upgrade_error'):
+                    lines.append(f"     Error: {network_result['upgrade_error']}")
+    else:
+        # Single network node
+        if result['upgrade_success']:
+            lines.append(f"✅ {name} upgrade completed successfully")
+        else:
+            lines.append(f"❌ {name} upgrade failed")
+            if result.get('upgrade_error'):
+                lines.append(f"   Error: {result['upgrade_error']}")
+    
+    if result.get('upgrade_output'):
+        lines.append(f"   Output: {result['upgrade_output']}")
+    return "\n".join(lines)
+
 @node_group.command(name='upgrade')
 @click.argument('node', required=False)
 @click.option('--all', is_flag=True, help='Upgrade all configured nodes')
@@ -973,65 +1115,36 @@ def upgrade(node, all):
         click.echo("❌ Must specify either --all or a node name")
         return
     
-    config = yaml.safe_load(get_config_path().read_text())
+    config = load_config()
     
     if all:
         # Upgrade all nodes
         click.echo("🔄 Upgrading all configured nodes with active Ethereum clients...")
         
-        for node_cfg in config.get('nodes', []):
+        nodes = config.get('nodes', [])
+        # Skip nodes with disabled eth-docker
+        enabled = [not _is_stack_disabled(n.get('stack', 'eth-docker')) and _has_ethereum_clients(n)
+                   for n in nodes]
+        # Upgrades run concurrently; reports are printed in config order as they finish
+        reports = _map_nodes(lambda n: _upgrade_node_report(n, n['name']),
+                             [n for n, is_enabled in zip(nodes, enabled) if is_enabled])
+        
+        for node_cfg, is_enabled in zip(nodes, enabled):
             name = node_cfg['name']
             
-            # Skip nodes with disabled eth-docker
-            stack = node_cfg.get('stack', 'eth-docker')
-            
-            if (_is_stack_disabled(stack) or not _has_ethereum_clients(node_cfg)):
+            if not is_enabled:
                 click.echo(f"⚪ Skipping {name} (Ethereum clients disabled)")
                 continue
                 
             click.echo(f"🔄 Upgrading {name}...")
             
-            # Use the enhanced upgrade function that supports multi-network
-            result = upgrade_node_docker_clients(node_cfg)
-            
-            # Check if this is a multi-network result
-            if 'overall_success' in result:
-                # Multi-network node
-                if result['overall_success']:
-                    click.echo(f"✅ {name} upgrade completed successfully for all networks")
-                else:
-                    click.echo(f"❌ {name} upgrade had some failures")
-                
-                # Show details for each network
-                for network_name, network_result in result.items():
-                    if network_name == 'overall_success':
-                        continue
-                    
-                    if network_result['upgrade_success']:
-                        click.echo(f"  ✅ {network_name}: Success")
-                    else:
-                        click.echo(f"  ❌ {network_name}: Failed")
-                        if network_result.get('upgrade_error'):
-                            click.echo(f"     Error: {network_result['upgrade_error']}")
-            else:
-                # Single network node
-                if result['upgrade_success']:
-                    click.echo(f"✅ {name} upgrade completed successfully")
-                else:
-                    click.echo(f"❌ {name} upgrade failed")
-                    if result.get('upgrade_error'):
-                        click.echo(f"   Error: {result['upgrade_error']}")
-            
-            if result.get('upgrade_output'):
-                click.echo(f"   Output: {result['upgrade_output']}")
+            _, report = next(reports)
+            click.echo(report)
         
         click.echo("🎉 All node upgrades completed!")
     else:
         # Upgrade single node
-        node_cfg = next(
-            (n for n in config['nodes'] if n.get('tailscale_domain') == node or n.get('name') == node),
-            None
-        )
+        node_cfg = get_node_config(node)
         if not node_cfg:
             click.echo(f"Node {node} not found")
             return
@@ -1045,48 +1158,136 @@ def upgrade(node, all):
         
         click.echo(f"🔄 Upgrading {node}...")
         
-        # Use the enhanced upgrade function that supports multi-network
-        result = upgrade_node_docker_clients(node_cfg)
-        
-        # Check if this is a multi-network result
-        if 'overall_success' in result:
-            # Multi-network node
-            if result['overall_success']:
-                click.echo(f"✅ {node} upgrade completed successfully for all networks")
-            else:
-                click.echo(f"❌ {node} upgrade had some failures")
-            
-            # Show details for each network
-            for network_name, network_result in result.items():
-                if network_name == 'overall_success':
-                    continue
-                
-                if network_result['upgrade_success']:
-                    click.echo(f"  ✅ {network_name}: Success")
-                else:
-                    click.echo(f"  ❌ {network_name}: Failed")
-                    if network_result.get('upgrade_error'):
-                        click.echo(f"     Error: {network_result['upgrade_error']}")
+        _, report = _upgrade_node_report(node_cfg, node)
+        click.echo(report)
+
+
+
+# Fixed cells of `node versions --all` rows (everything after the node name column)
+_ACTIVE_STATUS = ("🟢", "Active")
+_DISABLED_ROW_CELLS = ("Disabled", '❌ No clients', '-', '-', '❌ No clients', '-', '-', '-', '-', '-', '-', '-', '-')
+_ERROR_ROW_CELLS = ("Active", 'Error', '-', '❌', 'Error', '-', '❌', 'Error', '-', '❌', '-', '-', '-')
+
+# Placeholder values that mean "no usable version", shown as "-" in the version table
+_BAD_LATEST = frozenset({"Unknown", "API Error", "Network Error", "Rate Limited"})
+_BAD_LATEST_DISPLAY = _BAD_LATEST | {"-"}
+_BAD_VAL_LATEST = _BAD_LATEST_DISPLAY | {"Not Running", "Disabled"}
+_BAD_VAL_CURRENT = frozenset({"Unknown", "Not Running", "-"})
+_BAD_VAL_CLIENT = frozenset({"Unknown", "Disabled", "-"})
+
+# Per-network fields read from get_docker_client_versions() results, with their defaults
+_VERSION_DEFAULTS = {
+    'execution_client': 'Unknown', 'execution_current': 'Unknown',
+    'execution_latest': 'Unknown', 'execution_needs_update': False,
+    'consensus_client': 'Unknown', 'consensus_current': 'Unknown',
+    'consensus_latest': 'Unknown', 'consensus_needs_update': False,
+    'validator_client': '-', 'validator_current': '-',
+    'validator_latest': '-', 'validator_needs_update': False,
+}
+_VERSION_FIELDS = itemgetter(*_VERSION_DEFAULTS)
+
+def _charon_needs_update(charon_version, latest_charon):
+    """Whether a node's Charon differs from the latest release (unpinned 'latest' never does)"""
+    return (charon_version != "N/A" and latest_charon != "Unknown"
+            and charon_version != latest_charon and charon_version != "latest")
+
+def _update_state(needs_update, latest_known, current_known=True):
+    """Update cell of a version-table row: 🔄 outdated, ✅ current, ❓ no latest to compare, - not running"""
+    if needs_update:
+        return '🔄'
+    if not current_known:
+        return '-'
+    return '✅' if latest_known else '❓'
+
+def _charon_cells(charon_version, latest_charon):
+    """The (version, latest, update) DVT cells of a version-table row"""
+    if charon_version == "N/A":
+        return "-", "-", "-"
+    return charon_version, latest_charon, '🔄' if _charon_needs_update(charon_version, latest_charon) else '✅'
+
+def _build_node_rows(node_cfg, latest_charon):
+    """
+    Fetch live versions for one node and build its `node versions --all` table rows.
+    Multi-network nodes get one row per network. Returns (rows, error) where error is
+    the progress suffix to show if fetching the node's versions failed, else None.
+    """
+    rows = []
+    error = None
+    name = node_cfg['name']
+    domain = node_cfg['tailscale_domain']
+    ssh_target = f"{node_cfg.get('ssh_user', 'root')}@{domain}"
+    stack = node_cfg.get('stack', ['eth-docker'])
+    if isinstance(stack, str):
+        stack = [stack]
+    
+    status_emoji, status_text = _ACTIVE_STATUS
+    # Disabled node logic
+    if _is_stack_disabled(stack) or node_cfg.get('ethereum_clients_enabled') is False:
+        # Check if this is a validator-only node (like Charon + validator clients)
+        validator_info = _get_validator_only_clients(node_cfg)
+        if validator_info and validator_info['has_clients']:
+            status_emoji = "�"
+            charon_cells = _charon_cells(_get_charon_version(ssh_target, domain, node_cfg), latest_charon)
+            rows.append((
+                f"{status_emoji} {name}", status_text, f"🔗 {validator_info['display_name']}", '-', '-', f"🔗 {validator_info['display_name']}", '-', '-', '-', '-', '-'
+            ) + charon_cells)
         else:
-            # Single network node
-            if result['upgrade_success']:
-                click.echo(f"✅ {node} upgrade completed successfully")
-            else:
-                click.echo(f"❌ {node} upgrade failed")
-                if result.get('upgrade_error'):
-                    click.echo(f"   Error: {result['upgrade_error']}")
-        
-        if result.get('upgrade_output'):
-            click.echo(f"   Output: {result['upgrade_output']}")
-
-
+            rows.append((f"�🔴 {name}",) + _DISABLED_ROW_CELLS)
+    else:
+        # Charon runs once per host, so its cells are the same on every network row
+        charon_cells = _charon_cells(_get_charon_version(ssh_target, domain, node_cfg), latest_charon)
+        try:
+            version_info = get_docker_client_versions(node_cfg)
+            # Multi-network node
+            if 'mainnet' in version_info or 'testnet' in version_info:
+                for network_key, network_info in version_info.items():
+                    network_display_name = network_info.get('network', network_key)
+                    (exec_client, exec_current, exec_latest, exec_needs_update,
+                     cons_client, cons_current, cons_latest, cons_needs_update,
+                     val_client, val_current, val_latest, val_needs_update) = _VERSION_FIELDS({**_VERSION_DEFAULTS, **network_info})
+                    exec_display = f"{exec_client}/{exec_current}" if exec_client != "Unknown" else "-"
+                    exec_latest_display = exec_latest if exec_latest not in _BAD_LATEST else "-"
+                    exec_update = _update_state(exec_needs_update, exec_latest_display != "-")
+                    cons_display = f"{cons_client}/{cons_current}" if cons_client != "Unknown" else "-"
+                    cons_latest_display = cons_latest if cons_latest not in _BAD_LATEST else "-"
+                    cons_update = _update_state(cons_needs_update, cons_latest_display != "-")
+                    val_display = f"{val_client}/{val_current}" if val_client not in _BAD_VAL_CLIENT and val_current not in _BAD_VAL_CURRENT else "-"
+                    val_latest_display = val_latest if val_latest not in _BAD_VAL_LATEST else "-"
+                    val_update = _update_state(val_needs_update, val_latest_display != "-", val_display != "-")
+                    rows.append((
+                        f"{status_emoji} {name}-{network_display_name}", status_text, exec_display, exec_latest_display, exec_update, cons_display, cons_latest_display, cons_update, val_display, val_latest_display, val_update
+                    ) + charon_cells)
+                return rows, None
+            # Single-network node
+            (exec_client, exec_current, exec_latest, exec_needs_update,
+             cons_client, cons_current, cons_latest, cons_needs_update,
+             val_client, val_current, val_latest, val_needs_update) = _VERSION_FIELDS({**_VERSION_DEFAULTS, **version_info})
+            exec_display = f"{exec_client}/{exec_current}" if exec_client != "Unknown" else "-"
+            exec_latest_display = exec_latest if exec_latest not in _BAD_LATEST else "-"
+            exec_update = _update_state(exec_needs_update, exec_latest_display != "-")
+            cons_display = f"{cons_client}/{cons_current}" if cons_client != "Unknown" else "-"
+            cons_latest_display = cons_latest if cons_latest not in _BAD_LATEST else "-"
+            cons_update = _update_state(cons_needs_update, cons_latest_display != "-")
+            val_display = f"{val_client}/{val_current}" if val_client not in _BAD_VAL_CLIENT and val_current not in _BAD_VAL_CURRENT else "-"
+            val_latest_display = val_latest if val_latest not in _BAD_VAL_LATEST else "-"
+            val_update = _update_state(val_needs_update, val_latest_display != "-", val_display != "-")
+            rows.append((
+                f"{status_emoji} {name}", status_text, exec_display, exec_latest_display, exec_update, cons_display, cons_latest_display, cons_update, val_display, val_latest_display, val_update
+            ) + charon_cells)
+        except Exception as e:
+            rows.append((f"{status_emoji} {name}",) + _ERROR_ROW_CELLS)
+            error = f" ❌ Error: {str(e)[:30]}..."
+    return rows, error
 
 @node_group.command(name='versions')
 @click.argument('node', required=False)
 @click.option('--all', is_flag=True, help='Show client versions for all configured nodes')
-def versions(node, all):
+@_jobs_option
+def versions(node, all, jobs):
     """Query live client versions, sync status, and container health via SSH/API"""
-    config = yaml.safe_load(get_config_path().read_text())
+    from tabulate import tabulate
+
+    config = load_config()
     
     if all:
         nodes = config.get('nodes', [])
@@ -1102,136 +1303,70 @@ def versions(node, all):
         table_data = []
         active_nodes = 0
         disabled_nodes = 0
-        for i, node_cfg in enumerate(nodes):
-            name = node_cfg['name']
-            stack = node_cfg.get('stack', ['eth-docker'])
-            if isinstance(stack, str):
-                stack = [stack]
-            
-            click.echo(f"📡 Processing {name}... ({i+1}/{len(nodes)})", nl=False, err=True)
-            
-            status_emoji = "🟢"
-            status_text = "Active"
-            exec_display = cons_display = val_display = charon_display = "-"
-            exec_latest_display = cons_latest_display = val_latest_display = charon_latest_display = "-"
-            exec_update = cons_update = val_update = charon_update = "-"
-            # Disabled node logic
-            if _is_stack_disabled(stack) or node_cfg.get('ethereum_clients_enabled') is False:
-                # Check if this is a validator-only node (like Charon + validator clients)
-                validator_info = _get_validator_only_clients(node_cfg)
-                if validator_info and validator_info['has_clients']:
-                    status_emoji = "�"
-                    status_text = "Active"
-                    active_nodes += 1
-                    ssh_target = f"{node_cfg.get('ssh_user', 'root')}@{node_cfg['tailscale_domain']}"
-                    charon_version = _get_charon_version(ssh_target, node_cfg['tailscale_domain'], node_cfg)
-                    charon_needs_update = (charon_version != "N/A" and latest_charon != "Unknown" and charon_version != latest_charon and charon_version != "latest")
-                    charon_display = charon_version if charon_version != "N/A" else "-"
-                    charon_latest_display = latest_charon if charon_version != "N/A" else "-"
-                    charon_update = '🔄' if charon_needs_update else '✅' if charon_version != "N/A" else '-'
-                    table_data.append([
-                        f"{status_emoji} {name}", status_text, f"🔗 {validator_info['display_name']}", '-', '-', f"🔗 {validator_info['display_name']}", '-', '-', '-', '-', '-', charon_display, charon_latest_display, charon_update
-                    ])
-                    click.echo(" ✓", err=True)
-                else:
-                    status_emoji = "�🔴"
-                    status_text = "Disabled"
-                    disabled_nodes += 1
-                    click.echo(" ✓", err=True)
+        # Each node's fetch is independent SSH/HTTP wait, so run them side by side;
+        # _map_nodes() hands results back in config order for the progress lines and table.
+        results = _map_nodes(lambda n: _build_node_rows(n, latest_charon), nodes, jobs)
+        for i, (node_cfg, (rows, error)) in enumerate(zip(nodes, results)):
+            click.echo(f"📡 Processing {node_cfg['name']}... ({i+1}/{len(nodes)}){error or ' ✓'}", err=True)
+            if rows and rows[0][1] == "Disabled":
+                disabled_nodes += 1
             else:
                 active_nodes += 1
-                ssh_target = f"{node_cfg.get('ssh_user', 'root')}@{node_cfg['tailscale_domain']}"
-                charon_version = _get_charon_version(ssh_target, node_cfg['tailscale_domain'], node_cfg)
-                try:
-                    version_info = get_docker_client_versions(node_cfg)
-                    # Multi-network node
-                    if 'mainnet' in version_info or 'testnet' in version_info:
-                        for network_key, network_info in version_info.items():
-                            network_display_name = network_info.get('network', network_key)
-                            exec_client = network_info.get('execution_client', 'Unknown')
-                            exec_current = network_info.get('execution_current', 'Unknown')
-                            exec_latest = network_info.get('execution_latest', 'Unknown')
-                            exec_needs_update = network_info.get('execution_needs_update', False)
-                            cons_client = network_info.get('consensus_client', 'Unknown')
-                            cons_current = network_info.get('consensus_current', 'Unknown')
-                            cons_latest = network_info.get('consensus_latest', 'Unknown')
-                            cons_needs_update = network_info.get('consensus_needs_update', False)
-                            val_client = network_info.get('validator_client', '-')
-                            val_current = network_info.get('validator_current', '-')
-                            val_latest = network_info.get('validator_latest', '-')
-                            val_needs_update = network_info.get('validator_needs_update', False)
-                            charon_needs_update = (charon_version != "N/A" and latest_charon != "Unknown" and charon_version != latest_charon and charon_version != "latest")
-                            exec_display = f"{exec_client}/{exec_current}" if exec_client != "Unknown" else "-"
-                            exec_latest_display = exec_latest if exec_latest not in ["Unknown", "API Error", "Network Error", "Rate Limited"] else "-"
-                            exec_update = '🔄' if exec_needs_update else '✅' if exec_latest_display != "-" else '❓'
-                            cons_display = f"{cons_client}/{cons_current}" if cons_client != "Unknown" else "-"
-                            cons_latest_display = cons_latest if cons_latest not in ["Unknown", "API Error", "Network Error", "Rate Limited"] else "-"
-                            cons_update = '🔄' if cons_needs_update else '✅' if cons_latest_display != "-" else '❓'
-                            val_display = f"{val_client}/{val_current}" if val_client not in ["Unknown", "Disabled", "-"] and val_current not in ["Unknown", "Not Running", "-"] else "-"
-                            val_latest_display = val_latest if val_latest not in ["Unknown", "Not Running", "Disabled", "-", "API Error", "Network Error", "Rate Limited"] else "-"
-                            val_update = '🔄' if val_needs_update else '✅' if val_display != "-" and val_latest_display != "-" else '❓' if val_display != "-" else '-'
-                            charon_display = charon_version if charon_version != "N/A" else "-"
-                            charon_latest_display = latest_charon if charon_version != "N/A" else "-"
-                            charon_update = '🔄' if charon_needs_update else '✅' if charon_version != "N/A" else '-'
-                            table_data.append([
-                                f"{status_emoji} {name}-{network_display_name}", status_text, exec_display, exec_latest_display, exec_update, cons_display, cons_latest_display, cons_update, val_display, val_latest_display, val_update, charon_display, charon_latest_display, charon_update
-                            ])
-                        click.echo(" ✓", err=True)
-                        continue
-                    # Single-network node
-                    exec_client = version_info.get('execution_client', 'Unknown')
-                    exec_current = version_info.get('execution_current', 'Unknown')
-                    exec_latest = version_info.get('execution_latest', 'Unknown')
-                    exec_needs_update = version_info.get('execution_needs_update', False)
-                    cons_client = version_info.get('consensus_client', 'Unknown')
-                    cons_current = version_info.get('consensus_current', 'Unknown')
-                    cons_latest = version_info.get('consensus_latest', 'Unknown')
-                    cons_needs_update = version_info.get('consensus_needs_update', False)
-                    val_client = version_info.get('validator_client', '-')
-                    val_current = version_info.get('validator_current', '-')
-                    val_latest = version_info.get('validator_latest', '-')
-                    val_needs_update = version_info.get('validator_needs_update', False)
-                    charon_needs_update = (charon_version != "N/A" and latest_charon != "Unknown" and charon_version != latest_charon and charon_version != "latest")
-                    exec_display = f"{exec_client}/{exec_current}" if exec_client != "Unknown" else "-"
-                    exec_latest_display = exec_latest if exec_latest not in ["Unknown", "API Error", "Network Error"] else "-"
-                    exec_update = '🔄' if exec_needs_update else '✅' if exec_latest_display != "-" else '❓'
-                    cons_display = f"{cons_client}/{cons_current}" if cons_client != "Unknown" else "-"
-                    cons_latest_display = cons_latest if cons_latest not in ["Unknown", "API Error", "Network Error"] else "-"
-                    cons_update = '🔄' if cons_needs_update else '✅' if cons_latest_display != "-" else '❓'
-                    val_display = f"{val_client}/{val_current}" if val_client not in ["Unknown", "Disabled", "-"] and val_current not in ["Unknown", "Not Running", "-"] else "-"
-                    val_latest_display = val_latest if val_latest not in ["Unknown", "Not Running", "Disabled", "-", "API Error", "Network Error"] else "-"
-                    val_update = '🔄' if val_needs_update else '✅' if val_display != "-" and val_latest_display != "-" else '❓' if val_display != "-" else '-'
-                    charon_display = charon_version if charon_version != "N/A" else "-"
-                    charon_latest_display = latest_charon if charon_version != "N/A" else "-"
-                    charon_update = '🔄' if charon_needs_update else '✅' if charon_version != "N/A" else '-'
-                    table_data.append([
-                        f"{status_emoji} {name}", status_text, exec_display, exec_latest_display, exec_update, cons_display, cons_latest_display, cons_update, val_display, val_latest_display, val_update, charon_display, charon_latest_display, charon_update
-                    ])
-                    click.echo(" ✓", err=True)
-                except Exception as e:
-                    table_data.append([
-                        f"{status_emoji} {name}", status_text, 'Error', '-', '❌', 'Error', '-', '❌', 'Error', '-', '❌', '-', '-', '-'
-                    ])
-                    click.echo(f" ❌ Error: {str(e)[:30]}...", err=True)
-            # Disabled node row
-            if status_text == "Disabled":
-                table_data.append([
-                    f"{status_emoji} {name}", status_text, '❌ No clients', '-', '-', '❌ No clients', '-', '-', '-', '-', '-', '-', '-', '-'
-                ])
+            table_data.extend(rows)
         
         click.echo("\nRendering version table...")
         
         # Compact headers for double-line format
-        from colorama import Fore, Style
-        import re
         headers = ['Node', 'St', 'Execution', '✓', 'Consensus', '✓', 'Validator', '✓', 'DVT', '✓']
         
+        # Parse client info into name and version
+        def parse_client_info(client_version):
+            if client_version == "-" or not client_version or client_version == "No clients":
+                return "-", ""
+            # Handle validator-only display format (e.g., "🔗 charon/1.5.2 + lodestar/latest")
+            if client_version.startswith("🔗 "):
+                clean_version = client_version[2:]  # Remove emoji
+                if "/" in clean_version:
+                    parts = clean_version.split("/", 1)
+                    return parts[0], parts[1] if len(parts) > 1 else ""
+                return clean_version, ""
+            # Normal client format (e.g., "nethermind/1.32.4")
+            if "/" in client_version:
+                parts = client_version.split("/", 1)  # Split only on first /
+                return parts[0], parts[1] if len(parts) > 1 else ""
+            return client_version, ""
+        
+        # Parse DVT info specially to handle stack name vs version
+        def parse_dvt_info(charon_version):
+            if charon_version == "-" or not charon_version:
+                return "-", ""
+            # If it's just a version number, it's Charon
+            if charon_version and not "/" in charon_version and charon_version not in ["-", "N/A"]:
+                return "Charon", charon_version
+            # Handle other formats
+            if "/" in charon_version:
+                parts = charon_version.split("/", 1)
+                return parts[0].title(), parts[1] if len(parts) > 1 else ""
+            return charon_version, ""
+        
+        # Format version display: show "current → latest" if different, otherwise just "current"
+        def format_version_display(current, latest):
+            if not current or current == "-":
+                return ""
+            if not latest or latest == "-" or latest == current:
+                return current[:14]
+            # Show update needed: current→latest
+            return f"{current[:6]}→{latest[:6]}"
+        
         # Double-line table processing - each node gets two rows
         compact_table = []
         outdated_nodes = []
         for row in table_data:
+            (raw_node_name, status, exec_display, exec_latest, exec_update,
+             cons_display, cons_latest, cons_update, val_display, val_latest, val_update,
+             dvt_display, dvt_latest, dvt_update) = row
             # Smart node name handling - keep essential info but make readable
-            node_name = row[0]
+            node_name = raw_node_name
             if len(node_name) > 18:
                 # For multi-network nodes, show network suffix
                 if '-mainnet' in node_name or '-testnet' in node_name or '-hoodi' in node_name:
@@ -1241,23 +1376,13 @@ def versions(node, all):
                 else:
                     node_name = node_name[:16] + '…'
             
-            # Color for update status
-            def color_status(val):
-                if val == '🔄':
-                    return Fore.RED + val + Style.RESET_ALL
-                elif val == '✅':
-                    return Fore.GREEN + val + Style.RESET_ALL
-                elif val == '❓':
-                    return Fore.YELLOW + val + Style.RESET_ALL
-                return val
-            
             # Handle disabled nodes with dimmed colors
-            if row[1] == 'Disabled':
+            if status == 'Disabled':
                 compact_table.append([
-                    Fore.LIGHTBLACK_EX + node_name + Style.RESET_ALL,
-                    Fore.LIGHTBLACK_EX + "Off" + Style.RESET_ALL,
-                    Fore.LIGHTBLACK_EX + "No clients" + Style.RESET_ALL if exec_name != "-" else '-',
-                    Fore.LIGHTBLACK_EX + "No clients" + Style.RESET_ALL,
+                    f"{_DIM}{node_name}{_RESET}",
+                    _DIM_OFF,
+                    _DIM_NO_CLIENTS if exec_display != "-" else '-',
+                    _DIM_NO_CLIENTS,
                     '-',
                     '-', '-', '-', '-'
                 ])
@@ -1266,74 +1391,30 @@ def versions(node, all):
                 continue
             
             # Collect outdated nodes for upgrade
-            if '🔄' in [row[4], row[7], row[10], row[13]]:
-                raw_node_name = row[0]
-                clean_name = re.sub(r'[🟢🔴]|\x1b\[[0-9;]*m', '', raw_node_name).strip()
-                if '-mainnet' in clean_name or '-testnet' in clean_name or '-hoodi' in clean_name:
-                    clean_name = clean_name.split('-')[0]
+            if '🔄' in (exec_update, cons_update, val_update, dvt_update):
+                # Store the bare config name: drop the status emoji and any network suffix
+                clean_name = _strip_status_decor(raw_node_name).rpartition(' ')[2]
+                base_name, _, network_suffix = clean_name.rpartition('-')
+                if base_name and network_suffix in _NETWORK_SUFFIXES:
+                    clean_name = base_name
                 outdated_nodes.append(clean_name)
             
-            # Parse client info into name and version
-            def parse_client_info(client_version):
-                if client_version == "-" or not client_version or client_version == "No clients":
-                    return "-", ""
-                # Handle validator-only display format (e.g., "🔗 charon/1.5.2 + lodestar/latest")
-                if client_version.startswith("🔗 "):
-                    clean_version = client_version[2:]  # Remove emoji
-                    if "/" in clean_version:
-                        parts = clean_version.split("/", 1)
-                        return parts[0], parts[1] if len(parts) > 1 else ""
-                    return clean_version, ""
-                # Normal client format (e.g., "nethermind/1.32.4")
-                if "/" in client_version:
-                    parts = client_version.split("/", 1)  # Split only on first /
-                    return parts[0], parts[1] if len(parts) > 1 else ""
-                return client_version, ""
-            
-            # Parse DVT info specially to handle stack name vs version
-            def parse_dvt_info(charon_version):
-                if charon_version == "-" or not charon_version:
-                    return "-", ""
-                # If it's just a version number, it's Charon
-                if charon_version and not "/" in charon_version and charon_version not in ["-", "N/A"]:
-                    return "Charon", charon_version
-                # Handle other formats
-                if "/" in charon_version:
-                    parts = charon_version.split("/", 1)
-                    return parts[0].title(), parts[1] if len(parts) > 1 else ""
-                return charon_version, ""
-            
             # Extract client names and versions
-            exec_name, exec_version = parse_client_info(row[2])
-            cons_name, cons_version = parse_client_info(row[5])
-            val_name, val_version = parse_client_info(row[8])
-            dvt_name, dvt_version = parse_dvt_info(row[11])  # Special parsing for DVT
-            
-            # Extract latest versions from row data (positions 3, 6, 9, 12)
-            exec_latest = row[3] if len(row) > 3 else "-"
-            cons_latest = row[6] if len(row) > 6 else "-"  
-            val_latest = row[9] if len(row) > 9 else "-"
-            dvt_latest = row[12] if len(row) > 12 else "-"
+            exec_name, exec_version = parse_client_info(exec_display)
+            cons_name, cons_version = parse_client_info(cons_display)
+            val_name, val_version = parse_client_info(val_display)
+            dvt_name, dvt_version = parse_dvt_info(dvt_display)  # Special parsing for DVT
             
             # Clean up latest version displays
-            if exec_latest in ["Unknown", "API Error", "Network Error", "Rate Limited", "-"]:
+            if exec_latest in _BAD_LATEST_DISPLAY:
                 exec_latest = "-"
-            if cons_latest in ["Unknown", "API Error", "Network Error", "Rate Limited", "-"]:
+            if cons_latest in _BAD_LATEST_DISPLAY:
                 cons_latest = "-"
-            if val_latest in ["Unknown", "Not Running", "Disabled", "API Error", "Network Error", "Rate Limited", "-"]:
+            if val_latest in _BAD_VAL_LATEST:
                 val_latest = "-"
-            if dvt_latest in ["Unknown", "API Error", "Network Error", "Rate Limited", "-"]:
+            if dvt_latest in _BAD_LATEST_DISPLAY:
                 dvt_latest = "-"
             
-            # Format version display: show "current → latest" if different, otherwise just "current"
-            def format_version_display(current, latest):
-                if not current or current == "-":
-                    return ""
-                if not latest or latest == "-" or latest == current:
-                    return current[:14]
-                # Show update needed: current→latest
-                return f"{current[:6]}→{latest[:6]}"
-            
             # For validator-only nodes, show validator info in validator column only
             if exec_name.startswith("charon") or cons_name.startswith("charon"):
                 # This is a validator-only node, move the info to proper columns
@@ -1351,34 +1432,33 @@ def versions(node, all):
             # First row: Node name, status, client names, and update status
             compact_table.append([
                 node_name,
-                "On" if row[1] == "Active" else row[1][:3],
+                "On" if status == "Active" else status[:3],
                 exec_name[:14] if exec_name != "-" else "-",
-                color_status(row[4]),
+                _UPDATE_STATE_COLORED.get(exec_update, exec_update),
                 cons_name[:14] if cons_name != "-" else "-",
-                color_status(row[7]),
+                _UPDATE_STATE_COLORED.get(cons_update, cons_update),
                 val_name[:14] if val_name != "-" else "-",
-                color_status(row[10]),
+                _UPDATE_STATE_COLORED.get(val_update, val_update),
                 dvt_name[:14] if dvt_name != "-" else "-",
-                color_status(row[13])
+                _UPDATE_STATE_COLORED.get(dvt_update, dvt_update)
             ])
             
             # Second row: Empty node name/status, client versions with latest info
-            version_color = Fore.LIGHTBLACK_EX
             compact_table.append([
                 '',  # Empty node name
                 '',  # Empty status
-                version_color + format_version_display(exec_version, exec_latest) + Style.RESET_ALL if exec_version else '',
+                f"{_DIM}{format_version_display(exec_version, exec_latest)}{_RESET}" if exec_version else '',
                 '',  # Empty update status
-                version_color + format_version_display(cons_version, cons_latest) + Style.RESET_ALL if cons_version else '',
+                f"{_DIM}{format_version_display(cons_version, cons_latest)}{_RESET}" if cons_version else '',
                 '',  # Empty update status
-                version_color + format_version_display(val_version, val_latest) + Style.RESET_ALL if val_version else '',
+                f"{_DIM}{format_version_display(val_version, val_latest)}{_RESET}" if val_version else '',
                 '',  # Empty update status
-                version_color + format_version_display(dvt_version, dvt_latest) + Style.RESET_ALL if dvt_version else '',
+                f"{_DIM}{format_version_display(dvt_version, dvt_latest)}{_RESET}" if dvt_version else '',
                 ''   # Empty update status
             ])
         
         # Use grid format with compact double-line layout
-        click.echo(tabulate(compact_table, headers=headers, tablefmt='fancy_grid', 
+        click.echo(tabulate(compact_table, headers=headers, tablefmt=_table_format(compact_table), 
                            stralign='left', numalign='center', maxcolwidths=[16, 3, 14, 3, 14, 3, 14, 3, 14, 3]))
         click.echo(f"\n📊 CLUSTER SUMMARY:")
         click.echo(f"  🟢 Active: {active_nodes}  🔴 Disabled: {disabled_nodes}  Total: {len(nodes)}")
@@ -1387,26 +1467,35 @@ def versions(node, all):
             unique_outdated = list(dict.fromkeys(outdated_nodes))
             click.echo(f"\n⚠️  Nodes needing upgrade: {', '.join(unique_outdated)}")
             # Interactive prompt for upgrade
-            import sys
             if sys.stdin.isatty():
                 click.echo("\n💡 Would you like to start upgrade for outdated nodes now? [y/N]")
                 resp = input().strip().lower()
                 if resp == 'y':
                     click.echo("\n🚀 Starting upgrade for outdated nodes...")
+                    nodes_by_name = {n['name']: n for n in nodes}
+                    upgrade_targets = []
                     upgrade_results = []
-                    for node in unique_outdated:
-                        # Remove emoji and network suffix if present
-                        node_clean = node.split(' ')[-1].split('-')[0]
-                        # Remove color codes
-                        node_clean = node_clean.replace('🟢', '').replace('🔴', '').strip()
+                    for node_clean in unique_outdated:
+                        node_cfg = nodes_by_name.get(node_clean)
+                        if node_cfg is None or not _has_ethereum_clients(node_cfg):
+                            # Unknown names cannot be upgraded; nodes without Ethereum clients are skipped as in `node upgrade`
+                            click.echo(f"  ⚪ Skipping {node_clean} (Ethereum clients disabled)" if node_cfg else f"    ❌ {node_clean} not found")
+                            upgrade_results.append((node_clean, node_cfg is not None))
+                            continue
                         click.echo(f"  📡 Upgrading {node_clean}...")
-                        result = subprocess.run([sys.executable, '-m', 'eth_validators', 'node', 'upgrade', node_clean])
-                        if result.returncode == 0:
-                            click.echo(f"    ✅ {node_clean} upgrade completed")
-                            upgrade_results.append((node_clean, True))
-                        else:
-                            click.echo(f"    ❌ {node_clean} upgrade failed")
-                            upgrade_results.append((node_clean, False))
+                        upgrade_targets.append(node_cfg)
+                    # Upgrade in-process (no interpreter per node) and on all nodes at once;
+                    # each node's report is printed as a block, in order, once it is done.
+                    if upgrade_targets:
+                        reports = _map_nodes(lambda n: _upgrade_node_report(n, n['name']), upgrade_targets, jobs)
+                        for node_cfg, (ok, report) in zip(upgrade_targets, reports):
+                            node_clean = node_cfg['name']
+                            click.echo(report)
+                            if ok:
+                                click.echo(f"    ✅ {node_clean} upgrade completed")
+                            else:
+                                click.echo(f"    ❌ {node_clean} upgrade failed")
+                            upgrade_results.append((node_clean, ok))
                     click.echo("✅ All upgrade commands completed.")
                     
                     # Show updated table after upgrades
@@ -1414,91 +1503,23 @@ def versions(node, all):
                     click.echo("📊 POST-UPGRADE STATUS")
                     click.echo("="*70)
                     click.echo("🔄 Fetching updated version information...")
+                    _clear_docker_ps_snapshots()
                     
-                    # Re-fetch versions for upgraded nodes
+                    # Re-fetch versions for the upgraded nodes only, side by side
+                    upgraded_names = {r[0] for r in upgrade_results}
+                    nodes_to_refresh = [n for n in nodes if n['name'] in upgraded_names]
                     updated_table_data = []
-                    for node_cfg in nodes:
-                        name = node_cfg['name']
-                        if name in [r[0] for r in upgrade_results]:
-                            # This node was upgraded, re-fetch its versions
-                            try:
-                                version_info = get_docker_client_versions(node_cfg)
-                                ssh_target = f"{node_cfg.get('ssh_user', 'root')}@{node_cfg['tailscale_domain']}"
-                                charon_version = _get_charon_version(ssh_target, node_cfg['tailscale_domain'], node_cfg)
-                                
-                                # Process version info similar to main table
-                                if 'mainnet' in version_info or 'testnet' in version_info:
-                                    for network_key, network_info in version_info.items():
-                                        network_display_name = network_info.get('network', network_key)
-                                        exec_client = network_info.get('execution_client', 'Unknown')
-                                        exec_current = network_info.get('execution_current', 'Unknown')
-                                        exec_latest = network_info.get('execution_latest', 'Unknown')
-                                        exec_needs_update = network_info.get('execution_needs_update', False)
-                                        cons_client = network_info.get('consensus_client', 'Unknown')
-                                        cons_current = network_info.get('consensus_current', 'Unknown')
-                                        cons_latest = network_info.get('consensus_latest', 'Unknown')
-                                        cons_needs_update = network_info.get('consensus_needs_update', False)
-                                        val_client = network_info.get('validator_client', '-')
-                                        val_current = network_info.get('validator_current', '-')
-                                        val_latest = network_info.get('validator_latest', '-')
-                                        val_needs_update = network_info.get('validator_needs_update', False)
-                                        charon_needs_update = (charon_version != "N/A" and latest_charon != "Unknown" and charon_version != latest_charon and charon_version != "latest")
-                                        exec_display = f"{exec_client}/{exec_current}" if exec_client != "Unknown" else "-"
-                                        exec_latest_display = exec_latest if exec_latest not in ["Unknown", "API Error", "Network Error", "Rate Limited"] else "-"
-                                        exec_update = '🔄' if exec_needs_update else '✅' if exec_latest_display != "-" else '❓'
-                                        cons_display = f"{cons_client}/{cons_current}" if cons_client != "Unknown" else "-"
-                                        cons_latest_display = cons_latest if cons_latest not in ["Unknown", "API Error", "Network Error", "Rate Limited"] else "-"
-                                        cons_update = '🔄' if cons_needs_update else '✅' if cons_latest_display != "-" else '❓'
-                                        val_display = f"{val_client}/{val_current}" if val_client not in ["Unknown", "Disabled", "-"] and val_current not in ["Unknown", "Not Running", "-"] else "-"
-                                        val_latest_display = val_latest if val_latest not in ["Unknown", "Not Running", "Disabled", "-", "API Error", "Network Error", "Rate Limited"] else "-"
-                                        val_update = '🔄' if val_needs_update else '✅' if val_display != "-" and val_latest_display != "-" else '❓' if val_display != "-" else '-'
-                                        charon_display = charon_version if charon_version != "N/A" else "-"
-                                        charon_latest_display = latest_charon if charon_version != "N/A" else "-"
-                                        charon_update = '🔄' if charon_needs_update else '✅' if charon_version != "N/A" else '-'
-                                        updated_table_data.append([
-                                            f"🟢 {name}-{network_display_name}", exec_display, cons_display, val_display, charon_display
-                                        ])
-                                else:
-                                    exec_client = version_info.get('execution_client', 'Unknown')
-                                    exec_current = version_info.get('execution_current', 'Unknown')
-                                    exec_latest = version_info.get('execution_latest', 'Unknown')
-                                    exec_needs_update = version_info.get('execution_needs_update', False)
-                                    cons_client = version_info.get('consensus_client', 'Unknown')
-                                    cons_current = version_info.get('consensus_current', 'Unknown')
-                                    cons_latest = version_info.get('consensus_latest', 'Unknown')
-                                    cons_needs_update = version_info.get('consensus_needs_update', False)
-                                    val_client = version_info.get('validator_client', '-')
-                                    val_current = version_info.get('validator_current', '-')
-                                    val_latest = version_info.get('validator_latest', '-')
-                                    val_needs_update = version_info.get('validator_needs_update', False)
-                                    charon_needs_update = (charon_version != "N/A" and latest_charon != "Unknown" and charon_version != latest_charon and charon_version != "latest")
-                                    exec_display = f"{exec_client}/{exec_current}" if exec_client != "Unknown" else "-"
-                                    exec_latest_display = exec_latest if exec_latest not in ["Unknown", "API Error", "Network Error"] else "-"
-                                    exec_update = '🔄' if exec_needs_update else '✅' if exec_latest_display != "-" else '❓'
-                                    cons_display = f"{cons_client}/{cons_current}" if cons_client != "Unknown" else "-"
-                                    cons_latest_display = cons_latest if cons_latest not in ["Unknown", "API Error", "Network Error"] else "-"
-                                    cons_update = '🔄' if cons_needs_update else '✅' if cons_latest_display != "-" else '❓'
-                                    val_display = f"{val_client}/{val_current}" if val_client not in ["Unknown", "Disabled", "-"] and val_current not in ["Unknown", "Not Running", "-"] else "-"
-                                    val_latest_display = val_latest if val_latest not in ["Unknown", "Not Running", "Disabled", "-", "API Error", "Network Error"] else "-"
-                                    val_update = '🔄' if val_needs_update else '✅' if val_display != "-" and val_latest_display != "-" else '❓' if val_display != "-" else '-'
-                                    charon_display = charon_version if charon_version != "N/A" else "-"
-                                    charon_latest_display = latest_charon if charon_version != "N/A" else "-"
-                                    charon_update = '🔄' if charon_needs_update else '✅' if charon_version != "N/A" else '-'
-                                    updated_table_data.append([
-                                        f"🟢 {name}", exec_display, cons_display, val_display, charon_display
-                                    ])
-                            except Exception as e:
-                                updated_table_data.append([
-                                    f"❌ {name}",
-                                    "Error",
-                                    "Error", 
-                                    "Error",
-                                    "-"
-                                ])
+                    results = _map_nodes(lambda n: _build_node_rows(n, latest_charon), nodes_to_refresh, jobs)
+                    for node_cfg, (rows, error) in zip(nodes_to_refresh, results):
+                        if error:
+                            updated_table_data.append([f"❌ {node_cfg['name']}", "Error", "Error", "Error", "-"])
+                            continue
+                        # Keep the node, execution, consensus, validator and Charon columns
+                        updated_table_data.extend(itemgetter(0, 2, 5, 8, 11)(row) for row in rows)
                     
                     if updated_table_data:
                         update_headers = ['Node', 'Execution Client', 'Consensus Client', 'Validator Client', 'Charon']
-                        click.echo(tabulate(updated_table_data, headers=update_headers, tablefmt='fancy_grid', stralign='left'))
+                        click.echo(tabulate(updated_table_data, headers=update_headers, tablefmt=_table_format(updated_table_data), stralign='left'))
                         click.echo("\n✅ Upgrade summary:")
                         for node_name, success in upgrade_results:
                             status = "✅ Success" if success else "❌ Failed"
@@ -1507,14 +1528,11 @@ def versions(node, all):
                 else:
                     click.echo("ℹ️  Skipped upgrade.")
         else:
-            # Check if we have many unknown statuses (❓)
-            unknown_count = 0
-            for row in compact_table:
-                if len(row) > 4:  # Make sure row has enough columns
-                    # Count ❓ symbols in update status columns (indices 4, 7, 10, 13)
-                    unknown_count += sum(1 for i in [4, 7, 10, 13] if i < len(row) and '❓' in str(row[i]))
+            # Any unknown status (❓) in the raw rows' update columns (indices 4, 7, 10, 13)?
+            # The compact table only carries the colourised copies of these cells.
+            has_unknown = any(row[i] == '❓' for row in table_data for i in (4, 7, 10, 13))
             
-            if unknown_count > 0:
+            if has_unknown:
                 click.echo("❓ Version check status unclear due to GitHub API issues - some versions may need updates")
             else:
                 click.echo("✅ All nodes are up to date!")
@@ -1528,10 +1546,7 @@ def versions(node, all):
         return
     
     # Show detailed versions and status for single node
-    node_cfg = next(
-        (n for n in config['nodes'] if n.get('tailscale_domain') == node or n.get('name') == node),
-        None
-    )
+    node_cfg = get_node_config(node)
     if not node_cfg:
         click.echo(f"❌ Node {node} not found")
         return
@@ -1565,8 +1580,11 @@ def versions(node, all):
     except Exception as e:
         click.echo(f"⚠️  Could not fetch status information: {e}")
     
-    # Check for Charon version (Obol nodes)
+    # Check for Charon version (Obol nodes); every branch below shows the same status
     charon_version = _get_charon_version(ssh_target, node_cfg['tailscale_domain'], node_cfg)
+    if charon_version != "N/A":
+        latest_charon = _get_latest_charon_version()
+        charon_status = "🔄" if _charon_needs_update(charon_version, latest_charon) else "✅"
     
     # Check if Ethereum clients are disabled
     stack = node_cfg.get('stack', 'eth-docker')
@@ -1576,14 +1594,6 @@ def versions(node, all):
         validator_info = _get_validator_only_clients(node_cfg)
         if validator_info and validator_info['has_clients']:
             click.echo(f"\n📋 CLIENT VERSIONS:")
-            latest_charon = _get_latest_charon_version()
-            charon_needs_update = (charon_version != "N/A" and 
-                                 latest_charon != "Unknown" and 
-                                 charon_version != latest_charon and 
-                                 charon_version != "latest")
-            charon_display = charon_version if charon_version != "N/A" else "-"
-            charon_latest_display = latest_charon if charon_version != "N/A" else "-"
-            charon_update = '🔄' if charon_needs_update else '✅' if charon_version != "N/A" else '-'
             click.echo(f"🔗 Validator Infrastructure: {validator_info['display_name']}")
             if charon_version != "N/A":
                 click.echo(f"   • Charon (Obol DV): {charon_version} (Latest: {latest_charon}) {charon_status}")
@@ -1599,12 +1609,6 @@ def versions(node, all):
         else:
             click.echo(f"\n📋 CLIENT VERSIONS:")
             if charon_version != "N/A":
-                latest_charon = _get_latest_charon_version()
-                charon_needs_update = (charon_version != "N/A" and 
-                                     latest_charon != "Unknown" and 
-                                     charon_version != latest_charon and 
-                                     charon_version != "latest")
-                charon_status = "🔄" if charon_needs_update else "✅"
                 click.echo(f"🔗 Charon: {charon_version} (Latest: {latest_charon}) {charon_status}")
             else:
                 click.echo(f"⚪ Node {node} has Ethereum clients disabled")
@@ -1618,12 +1622,6 @@ def versions(node, all):
         
         # Display Charon version if available
         if charon_version != "N/A":
-            latest_charon = _get_latest_charon_version()
-            charon_needs_update = (charon_version != "N/A" and 
-                                 latest_charon != "Unknown" and 
-                                 charon_version != latest_charon and 
-                                 charon_version != "latest")
-            charon_status = "🔄" if charon_needs_update else "✅"
             click.echo(f"🔗 Charon: {charon_version} (Latest: {latest_charon}) {charon_status}")
         
         # Check if this is a multi-network result
@@ -1680,8 +1678,10 @@ def versions(node, all):
         # Fallback to ethd version command
         click.echo(f"\n📋 FALLBACK VERSION CHECK:")
         path = node_cfg.get('eth_docker_path', '~/eth-docker')
-        cmd = f"ssh {ssh_target} \"cd {path} && ./ethd version\""
-        subprocess.run(cmd, shell=True)
+        # Quote the path for the remote shell but keep a leading ~/ expandable there;
+        # argv form skips the local /bin/sh, and output still streams to the terminal
+        remote_path = f"~/{shlex.quote(path[2:])}" if path.startswith('~/') else shlex.quote(path)
+        subprocess.run(['ssh', *_ssh_mux_options().split(), ssh_target, f"cd {remote_path} && ./ethd version"])
 
 
 @node_group.command(name='add-node')
@@ -1694,8 +1694,7 @@ def add_node_interactive():
     
     # Load existing config
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config = load_config(config_path) or {}
     except FileNotFoundError:
         click.echo("❌ No config.yaml found. Please run 'python3 -m eth_validators quickstart' first.")
         return
@@ -1801,13 +1800,13 @@ def add_node_interactive():
             '/opt/eth-docker'
         ]
         
-        for path in common_paths:
-            test_cmd = f"test -d {path} && test -f {path}/docker-compose.yml"
-            result = _run_command(test_node_cfg, test_cmd)
-            if result.returncode == 0:
-                eth_docker_path = path
-                click.echo(f"✅ Found eth-docker at: {path}")
-                break
+        # Probe every candidate in one SSH round-trip; the first one present is echoed back.
+        test_cmd = " || ".join(f"{{ test -f {path}/docker-compose.yml && echo {path}; }}" for path in common_paths)
+        result = _run_command(test_node_cfg, test_cmd)
+        found_path = result.stdout.strip() if result.returncode == 0 else ""
+        if found_path in common_paths:
+            eth_docker_path = found_path
+            click.echo(f"✅ Found eth-docker at: {found_path}")
         
         if not eth_docker_path:
             click.echo("❓ Could not auto-detect eth-docker path. Using default.")
@@ -1871,8 +1870,7 @@ def add_node_interactive():
         config['nodes'].append(new_node)
         
         # Save to file
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        save_config(config, config_path)
         
         click.echo(f"✅ Node '{node_name}' added successfully!")
         click.echo(f"📁 Configuration saved to: {config_path}")
@@ -1889,6 +1887,9 @@ def add_node_interactive():
         return
 
 
+# A comma-separated list of numbers, e.g. "1, 3,5"
+_STACK_SELECTION_RE = re.compile(r'\d+(?:\s*,\s*\d+)*')
+
 def _manual_stack_selection():
     """Interactive stack selection helper"""
     click.echo("\n🛠️  Available stacks:")
@@ -1909,35 +1910,67 @@ def _manual_stack_selection():
     selected_stacks = []
     
     while True:
-        try:
-            selection = click.prompt(
-                "\nSelect stack numbers (comma-separated, e.g., '1,2')", 
-                type=str
-            ).strip()
-            
-            if not selection:
-                break
-                
-            indices = [int(x.strip()) for x in selection.split(',')]
-            for idx in indices:
-                if 1 <= idx <= len(stacks):
-                    stack_name = stacks[idx-1][0]
-                    if stack_name not in selected_stacks:
-                        selected_stacks.append(stack_name)
-                else:
-                    click.echo(f"❌ Invalid selection: {idx}")
-                    continue
-            
-            if selected_stacks:
-                click.echo(f"Selected: {', '.join(selected_stacks)}")
-                break
-            
-        except ValueError:
+        selection = click.prompt(
+            "\nSelect stack numbers (comma-separated, e.g., '1,2')", 
+            type=str
+        ).strip()
+        
+        if not selection:
+            break
+        
+        # Validate the whole line up front rather than failing on the first bad token
+        if not _STACK_SELECTION_RE.fullmatch(selection):
             click.echo("❌ Please enter valid numbers separated by commas")
+            continue
+        
+        for idx in map(int, re.findall(r'\d+', selection)):
+            if 1 <= idx <= len(stacks):
+                stack_name = stacks[idx-1][0]
+                if stack_name not in selected_stacks:
+                    selected_stacks.append(stack_name)
+            else:
+                click.echo(f"❌ Invalid selection: {idx}")
+        
+        if selected_stacks:
+            click.echo(f"Selected: {', '.join(selected_stacks)}")
+            break
     
     return selected_stacks if selected_stacks else ["eth-docker"]
 
 
+_P2P_PROTOS = frozenset({'tcp', 'udp'})
+
+def _is_p2p_port(port_num, proto):
+    """Whether a host port is in a P2P range that typically needs router forwarding"""
+    return ((30300 <= port_num <= 30400 and proto in _P2P_PROTOS) or  # EL P2P
+            (9000 <= port_num <= 9100 and proto in _P2P_PROTOS) or    # CL P2P
+            (3600 <= port_num <= 3700 and proto == 'tcp') or          # Charon DV
+            (12000 <= port_num <= 13000 and proto in _P2P_PROTOS))    # Other P2P
+
+def _is_p2p_port_entry(e):
+    """Filter for `node ports --p2p-only`"""
+    # get_node_port_mappings() already gives int ports and lower-case protocols
+    p = e.get('host_port')
+    if p is None:
+        return False
+    proto = e.get('proto', 'tcp')
+
+    # EL P2P ports (standard and custom forwarding range)
+    if 30300 <= p <= 30400 and proto in _P2P_PROTOS:
+        return True
+    # CL P2P ports (standard and custom forwarding range)
+    if 9000 <= p <= 9100 and proto in _P2P_PROTOS:
+        return True
+    # Charon DV ports (typically forwarded)
+    if 3600 <= p <= 3700 and proto == 'tcp':
+        return True
+    # Other common P2P ports
+    if p in (12000, 13000) and proto in _P2P_PROTOS:
+        return True
+
+    return False
+
+
 @node_group.command(name='ports')
 @click.argument('node', required=False)
 @click.option('--all', is_flag=True, help='Show port mappings for all configured nodes')
@@ -1948,7 +1981,9 @@ def _manual_stack_selection():
 @click.option('--csv', is_flag=True, help='Output in CSV format')
 def node_ports(node, all, source, p2p_only, published_only, csv):
     """List open/forwarded ports per node and detect conflicts across nodes on the same network."""
-    config = yaml.safe_load(get_config_path().read_text())
+    from tabulate import tabulate
+
+    config = load_config()
 
     if all and node:
         click.echo("❌ Cannot specify both --all and a node name")
@@ -1963,34 +1998,52 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
         return
 
     if not all:
-        node_cfg = next((n for n in nodes if n.get('tailscale_domain') == node or n.get('name') == node), None)
+        node_cfg = get_node_config(node)
         if not node_cfg:
             click.echo(f"❌ Node {node} not found")
             return
         nodes = [node_cfg]
 
-    click.echo("🔎 Gathering port mappings...")
+    # In CSV mode stdout carries only the CSV stream, so progress goes to stderr
+    click.echo("🔎 Gathering port mappings...", err=csv)
 
     per_node_tables = []
-    conflicts = {}
+    conflicts = defaultdict(list)
     entries_all = []
 
-    # For CSV output, collect all rows first
-    csv_rows = []
-    csv_headers = ['Node', 'Service', 'Container', 'Host Port', 'Container Port', 'Protocol', 'Source', 'Network', 'Exposure', 'Public IP']
+    # CSV rows are written as each node's results come in rather than collected first
+    if csv:
+        import csv as csv_module
+        writer = csv_module.writer(sys.stdout)
+        writer.writerow(['Node', 'Service', 'Container', 'Host Port', 'Container Port', 'Protocol', 'Source', 'Network', 'Exposure', 'Public IP'])
+
+    def _probe_node(ncfg):
+        name = ncfg.get('name', ncfg.get('tailscale_domain'))
+        try:
+            result = run_command_on_node(name, "curl -s https://api.ipify.org", ncfg)
+            public_ip = result.strip() if result and result.strip() else "unknown"
+        except Exception as e:
+            public_ip = "unknown"
 
-    for i, ncfg in enumerate(nodes):
-        name = ncfg.get('name', ncfg.get('tailscale_domain', f"node{i+1}"))
         stack = ncfg.get('stack', ['eth-docker'])
         if isinstance(stack, str):
             stack = [stack]
 
         # Skip disabled stacks, but still allow env-based ports if desired
         if 'disabled' in [s.lower() for s in stack]:
-            click.echo(f"⚪ Skipping disabled node {name}")
+            return None, public_ip
+        return get_node_port_mappings(ncfg, source=source), public_ip
+
+    # Probe every node at once; the filtering and conflict bookkeeping below stay
+    # on this thread and see the results in config order.
+    public_ips = {}
+    for i, (ncfg, (res, public_ip)) in enumerate(zip(nodes, _map_nodes(_probe_node, nodes))):
+        name = ncfg.get('name', ncfg.get('tailscale_domain', f"node{i+1}"))
+        public_ips[name] = public_ip
+        if res is None:
+            click.echo(f"⚪ Skipping disabled node {name}", err=csv)
             continue
 
-        res = get_node_port_mappings(ncfg, source=source)
         entries = res.get('entries', [])
         errors = res.get('errors', [])
 
@@ -1998,33 +2051,38 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
         if published_only:
             entries = [e for e in entries if e.get('source') == 'docker' and e.get('published')]
         if p2p_only:
-            def _is_p2p_port_entry(e):
-                hp = e.get('host_port')
-                proto = e.get('proto', 'tcp')
-                if hp is None:
-                    return False
-                try:
-                    p = int(hp)
-                except (ValueError, TypeError):
-                    return False
-                proto = str(proto).lower()
-
-                # EL P2P ports (standard and custom forwarding range)
-                if 30300 <= p <= 30400 and proto in ('tcp', 'udp'):
-                    return True
-                # CL P2P ports (standard and custom forwarding range)
-                if 9000 <= p <= 9100 and proto in ('tcp', 'udp'):
-                    return True
-                # Charon DV ports (typically forwarded)
-                if 3600 <= p <= 3700 and proto == 'tcp':
-                    return True
-                # Other common P2P ports
-                if p in (12000, 13000) and proto in ('tcp', 'udp'):
-                    return True
-
-                return False
             entries = [e for e in entries if _is_p2p_port_entry(e)]
 
+        # CSV mode only needs the rows; skip the table and conflict bookkeeping
+        if csv:
+            for e in entries:
+                # Determine exposure type for CSV
+                exposure = 'Internal'
+                host_port = e.get('host_port')
+                if host_port is not None:
+                    port_num = host_port
+                    proto = e.get('proto', 'tcp')
+                    
+                    # P2P ports that typically require public exposure
+                    if _is_p2p_port(port_num, proto):
+                        exposure = 'Public P2P'
+                    else:
+                        exposure = 'Public Service'
+                
+                writer.writerow([
+                    name,
+                    e.get('service','-'),
+                    e.get('container','-'),
+                    e.get('host_port') if e.get('host_port') is not None else '-',
+                    e.get('container_port') if e.get('container_port') is not None else '-',
+                    e.get('proto','tcp'),
+                    e.get('source','-'),
+                    e.get('network','-'),
+                    exposure,
+                    public_ip
+                ])
+            continue
+
         # Build table rows for this node
         rows = []
         for e in entries:
@@ -2033,14 +2091,11 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
             host_port = e.get('host_port')
             if host_port is not None:
                 # Check if this is a P2P port that requires router forwarding
-                port_num = int(host_port) if str(host_port).isdigit() else 0
+                port_num = host_port
                 proto = e.get('proto', 'tcp')
                 
                 # P2P ports that typically require public exposure
-                if ((30300 <= port_num <= 30400 and proto in ('tcp', 'udp')) or  # EL P2P
-                    (9000 <= port_num <= 9100 and proto in ('tcp', 'udp')) or    # CL P2P  
-                    (3600 <= port_num <= 3700 and proto == 'tcp') or             # Charon DV
-                    (12000 <= port_num <= 13000 and proto in ('tcp', 'udp'))):  # Other P2P
+                if _is_p2p_port(port_num, proto):
                     exposure = '🌐 Public P2P'
                 else:
                     exposure = '🌐 Public Service'
@@ -2063,7 +2118,7 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
             net = e.get('network', '-')
             if hp is not None:
                 key = (hp, proto, net)
-                conflicts.setdefault(key, []).append({
+                conflicts[key].append({
                     'node': name,
                     'service': e.get('service','-'),
                     'container': e.get('container','-'),
@@ -2075,65 +2130,7 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
         headers = ['Service', 'Container', 'Host Port', 'Container Port', 'Proto', 'Source', 'Network', 'Exposure']
         per_node_tables.append((name, rows, headers, errors, None, ncfg))
 
-        # Add to CSV if requested
-        if csv:
-            for e in entries:
-                # Determine exposure type for CSV
-                exposure = 'Internal'
-                host_port = e.get('host_port')
-                if host_port is not None:
-                    port_num = int(host_port) if str(host_port).isdigit() else 0
-                    proto = e.get('proto', 'tcp')
-                    
-                    # P2P ports that typically require public exposure
-                    if ((30300 <= port_num <= 30400 and proto in ('tcp', 'udp')) or  # EL P2P
-                        (9000 <= port_num <= 9100 and proto in ('tcp', 'udp')) or    # CL P2P  
-                        (3600 <= port_num <= 3700 and proto == 'tcp') or             # Charon DV
-                        (12000 <= port_num <= 13000 and proto in ('tcp', 'udp'))):  # Other P2P
-                        exposure = 'Public P2P'
-                    else:
-                        exposure = 'Public Service'
-                
-                csv_rows.append([
-                    name,
-                    e.get('service','-'),
-                    e.get('container','-'),
-                    e.get('host_port') if e.get('host_port') is not None else '-',
-                    e.get('container_port') if e.get('container_port') is not None else '-',
-                    e.get('proto','tcp'),
-                    e.get('source','-'),
-                    e.get('network','-'),
-                    exposure,
-                    'N/A'  # Public IP placeholder, will be filled later
-                ])
-
-    # Detect public IPs for each node
-    public_ips = {}
-    for i, ncfg in enumerate(nodes):
-        name = ncfg.get('name', ncfg.get('tailscale_domain', f"node{i+1}"))
-        try:
-            result = run_command_on_node(name, "curl -s https://api.ipify.org", ncfg)
-            if result and result.strip():
-                public_ips[name] = result.strip()
-            else:
-                public_ips[name] = "unknown"
-        except Exception as e:
-            public_ips[name] = "unknown"
-
-    # Update CSV rows with actual public IPs
-    if csv:
-        for i, row in enumerate(csv_rows):
-            node_name = row[0]  # First column is node name
-            row[9] = public_ips.get(node_name, "unknown")  # Update public IP column
-
-    # CSV output mode
     if csv:
-        import sys
-        import csv as csv_module
-        writer = csv_module.writer(sys.stdout)
-        writer.writerow(csv_headers)
-        for row in csv_rows:
-            writer.writerow(row)
         return
 
     # Build P2P port usage matrix - get rows for each node
@@ -2148,12 +2145,7 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
                     port_num = int(host_port)
                     # Check if this is a P2P port by service name OR port range
                     is_p2p_by_name = ('p2p' in service.lower() or 'discovery' in service.lower())
-                    is_p2p_by_port = (
-                        (30300 <= port_num <= 30400 and proto.lower() in ('tcp', 'udp')) or  # EL P2P
-                        (9000 <= port_num <= 9100 and proto.lower() in ('tcp', 'udp')) or    # CL P2P
-                        (3600 <= port_num <= 3700 and proto.lower() == 'tcp') or             # Charon P2P
-                        (12000 <= port_num <= 13000 and proto.lower() in ('tcp', 'udp'))    # Other P2P
-                    )
+                    is_p2p_by_port = _is_p2p_port(port_num, proto.lower())
                     
                     if is_p2p_by_name or is_p2p_by_port:
                         p2p_ports[name].add(port_num)
@@ -2194,7 +2186,7 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
             click.echo(f"🔗 Shared IP with: {', '.join(other_nodes)}")
 
         if rows:
-            click.echo(tabulate(rows, headers=headers, tablefmt='fancy_grid', stralign='left', numalign='center'))
+            click.echo(tabulate(rows, headers=headers, tablefmt=_table_format(rows), stralign='left', numalign='center'))
         else:
             click.echo("(no mappings found)")
         if errors:
@@ -2348,7 +2340,7 @@ def node_ports(node, all, source, p2p_only, published_only, csv):
     click.echo("="*70)
     if conflict_rows:
         click.echo(tabulate(conflict_rows, headers=['Host Port','Proto','Network','Count','Nodes','Details'],
-                           tablefmt='fancy_grid', stralign='left', numalign='center'))
+                           tablefmt=_table_format(conflict_rows), stralign='left', numalign='center'))
         click.echo(f"\n💡 To resolve conflicts, you can:")
         click.echo(f"   • Run 'python3 -m eth_validators node ports --all' to see all conflicts")
         click.echo(f"   • Manually edit .env files to change conflicting ports")
@@ -2402,7 +2394,24 @@ def config_validate(config, fix, report):
     automation = ConfigAutomationSystem(config)
     
     try:
-        issues, repairs = automation.validate_current_config(auto_repair=fix)
+        # Echo critical issues as soon as their node finishes, everything else after the last one
+        results = []
+        for node_index, node_issues, node_repairs in automation.iter_validate_current_config(auto_repair=fix):
+            results.append((node_index, node_issues, node_repairs))
+            for i in node_issues:
+                if i.severity == 'critical':
+                    click.echo(f"🚨 {i.node}: {i.description}")
+                    if i.suggested_value:
+                        click.echo(f"     💡 Suggested: {i.suggested_value}")
+        
+        # Back to config order so the summary and report are deterministic
+        results.sort(key=lambda r: r[0])
+        issues = [i for _, node_issues, _ in results for i in node_issues]
+        repairs = [r for _, _, node_repairs in results for r in node_repairs]
+        by_severity = defaultdict(list)
+        for i in issues:
+            by_severity[i.severity].append(i)
+        auto_fixable = sum(1 for i in issues if i.auto_fixable)
         
         if not issues:
             click.echo("🎉 Configuration is valid - no issues detected!")
@@ -2410,25 +2419,27 @@ def config_validate(config, fix, report):
         
         click.echo(f"\n⚠️  Found {len(issues)} configuration issues:")
         
-        # Group issues by severity
-        critical = [i for i in issues if i.severity == 'critical']
-        warning = [i for i in issues if i.severity == 'warning']
-        info = [i for i in issues if i.severity == 'info']
+        critical = by_severity['critical']
+        warning = by_severity['warning']
+        info = by_severity['info']
         
         for severity, issue_list, emoji in [('CRITICAL', critical, '🚨'), ('WARNING', warning, '⚠️'), ('INFO', info, 'ℹ️')]:
             if issue_list:
-                click.echo(f"\n{emoji} {severity} ({len(issue_list)} issues):")
+                if severity == 'CRITICAL':
+                    # Already listed above as they came in
+                    click.echo(f"\n{emoji} {severity} ({len(issue_list)} issues, listed above)")
+                    continue
+                lines = [f"\n{emoji} {severity} ({len(issue_list)} issues):"]
                 for issue in issue_list:
-                    click.echo(f"   • {issue.node}: {issue.description}")
+                    lines.append(f"   • {issue.node}: {issue.description}")
                     if issue.suggested_value:
-                        click.echo(f"     💡 Suggested: {issue.suggested_value}")
+                        lines.append(f"     💡 Suggested: {issue.suggested_value}")
+                click.echo("\n".join(lines))
         
         if repairs and fix:
-            click.echo(f"\n🔧 Applied {len(repairs)} automatic repairs:")
-            for repair in repairs:
-                click.echo(f"   ✅ {repair.node}: {repair.description}")
-        elif not fix and any(i.auto_fixable for i in issues):
-            auto_fixable = len([i for i in issues if i.auto_fixable])
+            click.echo("\n".join([f"\n🔧 Applied {len(repairs)} automatic repairs:"] +
+                                  [f"   ✅ {repair.node}: {repair.description}" for repair in repairs]))
+        elif not fix and auto_fixable:
             click.echo(f"\n💡 {auto_fixable} issues can be automatically fixed with --fix flag")
         
         # Save report if requested
@@ -2451,8 +2462,15 @@ def config_validate(config, fix, report):
                 ]
             }
             
-            with open(report, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            # orjson is optional; it serialises straight to bytes when installed
+            try:
+                import orjson
+            except ImportError:
+                with open(report, 'w') as f:
+                    json.dump(report_data, f, indent=2)
+            else:
+                with open(report, 'wb') as f:
+                    f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
             
             click.echo(f"\n📄 Validation report saved to: {report}")
     
@@ -2463,11 +2481,6 @@ def config_validate(config, fix, report):
 
 def _resolve_port_conflicts_interactive(conflicts, node_configs):
     """Interactive port conflict resolution with batched .env updates and service restarts"""
-    import random
-    import os
-    import subprocess
-    from pathlib import Path
-    
     click.echo(f"\n🔍 Analyzing conflicts and suggesting solutions...")
     
     # Get all currently used ports across all nodes to avoid suggesting conflicts
@@ -2476,10 +2489,14 @@ def _resolve_port_conflicts_interactive(conflicts, node_configs):
         used_ports.add(conflict['port'])
     
     # Add other known ports from the port mappings
-    for node_name, node_cfg in node_configs.items():
+    def _fetch_port_mappings(node_cfg):
+        try:
+            return get_node_port_mappings(node_cfg)
+        except:
+            return {}
+
+    for port_data in _map_nodes(_fetch_port_mappings, list(node_configs.values())):
         try:
-            from eth_validators.node_manager import get_node_port_mappings
-            port_data = get_node_port_mappings(node_cfg)
             for entry in port_data.get('entries', []):
                 if entry.get('host_port'):
                     used_ports.add(int(entry['host_port']))
@@ -2582,9 +2599,6 @@ def _resolve_port_conflicts_interactive(conflicts, node_configs):
 
 def _detect_system_network_issues():
     """Detect system-level network issues that could cause container instability"""
-    import subprocess
-    import re
-    
     issues = []
     
     # Check UDP buffer sizes
@@ -2911,7 +2925,7 @@ def _update_env_file(node_config, env_file, env_var, new_value, is_local):
             sed_cmd = f"sed -i 's/^{env_var}=.*$/{env_var}={new_value}/' {env_file}"
             add_cmd = f"grep -q '^{env_var}=' {env_file} || echo '{env_var}={new_value}' >> {env_file}"
             
-            ssh_cmd = f"ssh {ssh_user}@{tailscale_domain} '{sed_cmd} && {add_cmd}'"
+            ssh_cmd = f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} '{sed_cmd} && {add_cmd}'"
             
             result = subprocess.run(ssh_cmd, shell=True, capture_output=True, text=True)
             return result.returncode == 0
@@ -2955,15 +2969,15 @@ def _restart_eth_docker(node_config, eth_docker_path, is_local):
             tailscale_domain = node_config.get('tailscale_domain')
             
             # Check if ./ethd exists and use it, otherwise fallback to docker compose
-            check_cmd = f"ssh {ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && test -x ./ethd'"
+            check_cmd = f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && test -x ./ethd'"
             check_result = subprocess.run(check_cmd, shell=True, capture_output=True, text=True)
             
             if check_result.returncode == 0:
                 # Use ./ethd down && ./ethd up -d
-                ssh_cmd = f"ssh {ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && ./ethd down && ./ethd up -d'"
+                ssh_cmd = f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && ./ethd down && ./ethd up -d'"
             else:
                 # Fallback to docker compose
-                ssh_cmd = f"ssh {ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && docker compose down && docker compose up -d'"
+                ssh_cmd = f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && docker compose down && docker compose up -d'"
             
             result = subprocess.run(ssh_cmd, shell=True, capture_output=True, text=True)
             return result.returncode == 0
@@ -2978,7 +2992,9 @@ def _restart_eth_docker(node_config, eth_docker_path, is_local):
 @click.option('--csv', is_flag=True, help='Output in CSV format')
 def node_status(all, csv):
     """📊 Show comprehensive node status with ports, IPs, and peer counts"""
-    config = yaml.safe_load(get_config_path().read_text())
+    from tabulate import tabulate
+
+    config = load_config()
     nodes = config.get('nodes', [])
     
     if not nodes:
@@ -3130,7 +3146,6 @@ def node_status(all, csv):
     
     # Output in requested format
     if csv:
-        import csv
         click.echo("Node,Hostname,Local IP,P2P Ports,Execution Ports,Peer Count,Status")
         for row in table_data:
             click.echo(",".join(str(cell) for cell in row))
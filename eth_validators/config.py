@@ -2,10 +2,22 @@
 Handles loading configuration from config.yaml and providing
 helper functions to access node configurations.
 """
+import copy
 import yaml
 import os
+from functools import lru_cache
 from pathlib import Path
 
+# libyaml's C loader parses several times faster when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Resolved config paths keyed by (cwd, PROJECT_ROOT); commands resolve the path
+# several times (load_config, get_node_config, ...) and the search is up to four stats
+_config_paths = {}
+
 def get_config_path():
     """
     Find config.yaml in multiple locations with priority:
@@ -14,6 +26,18 @@ def get_config_path():
     3. Parent directory of eth_validators module (project root)
     4. eth_validators directory itself (for backward compatibility)
     """
+    key = (os.getcwd(), os.environ.get('PROJECT_ROOT'))
+    cached = _config_paths.get(key)
+    if cached is not None and cached.exists():
+        return cached
+    path = _find_config_path()
+    # Only remember a file that exists, so a config created later is still picked up
+    if path.exists():
+        _config_paths[key] = path
+    return path
+
+def _find_config_path():
+    """Search the locations listed in get_config_path() for config.yaml"""
     # First check current working directory (where user runs the command)
     current_dir_config = Path.cwd() / 'config.yaml'
     if current_dir_config.exists():
@@ -35,22 +59,55 @@ def get_config_path():
     default_config = Path(__file__).parent / 'config.yaml'
     return default_config
 
+@lru_cache(maxsize=4)
+def _parse_config(path_str, mtime_ns):
+    """Parse a config file; keyed by mtime so an edited file is parsed again"""
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+def load_config(path=None):
+    """
+    Loads config.yaml (or the given path), reusing the previous parse while the
+    file is unchanged. Returns a fresh copy that callers are free to modify.
+    """
+    path = Path(path or get_config_path())
+    return copy.deepcopy(_parse_config(str(path), path.stat().st_mtime_ns))
+
+def save_config(config, path=None):
+    """Writes config back to config.yaml (or the given path), keeping key order"""
+    text = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+    Path(path or get_config_path()).write_text(text)
+
 def get_all_node_configs():
     """Loads and returns all node configurations from config.yaml."""
     try:
-        with open(get_config_path(), 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config()
         return config.get('nodes', [])
     except (FileNotFoundError, yaml.YAMLError):
         return []
 
+@lru_cache(maxsize=4)
+def _node_index(path_str, mtime_ns):
+    """Map each node's name and tailscale_domain to its position in the nodes list"""
+    index = {}
+    for i, node_cfg in enumerate((_parse_config(path_str, mtime_ns) or {}).get('nodes', [])):
+        # setdefault keeps the first match, like a scan of the list would
+        for key in (node_cfg.get('name'), node_cfg.get('tailscale_domain')):
+            if key is not None:
+                index.setdefault(key, i)
+    return index
+
 def get_node_config(name_or_domain):
     """
     Finds and returns the configuration for a single node by its name
     or tailscale_domain.
     """
-    all_nodes = get_all_node_configs()
-    for node_cfg in all_nodes:
-        if node_cfg.get('name') == name_or_domain or node_cfg.get('tailscale_domain') == name_or_domain:
-            return node_cfg
-    return None
+    try:
+        path = get_config_path()
+        mtime_ns = path.stat().st_mtime_ns
+        i = _node_index(str(path), mtime_ns).get(name_or_domain)
+    except (FileNotFoundError, yaml.YAMLError):
+        return None
+    if i is None:
+        return None
+    return copy.deepcopy(_parse_config(str(path), mtime_ns)['nodes'][i])
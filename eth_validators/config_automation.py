@@ -17,7 +17,7 @@ import subprocess
 import json
 import re
 import yaml
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -78,6 +78,10 @@ class ConfigAutomationSystem:
     def validate_current_config(self, auto_repair: bool = False) -> Tuple[List[ValidationIssue], List[RepairAction]]:
         """Validate current configuration and optionally auto-repair"""
         return self.validator.validate_and_repair(self.config_file_path, auto_repair)
+    
+    def iter_validate_current_config(self, auto_repair: bool = False) -> Iterator[Tuple[int, List[ValidationIssue], List[RepairAction]]]:
+        """Validate current configuration, yielding (node_index, issues, repairs) per node as each completes"""
+        return self.validator.iter_validate_and_repair(self.config_file_path, auto_repair)
         
     def sync_all_nodes(self) -> Dict[str, DiscoveryResult]:
         """Sync configuration for all nodes"""
@@ -6,13 +6,15 @@ provides drift detection, and enables cluster-wide synchronization.
 """
 
 import logging
-import yaml
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from .auto_discovery import AutoConfigDiscovery
+from .config import load_config, save_config
 from .config_validator import ConfigValidator, ValidationIssue
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,8 @@ class ConfigMonitor:
         self.discovery = AutoConfigDiscovery()
         self.validator = ConfigValidator()
         self.drift_history = []
+        # node name -> (container fingerprint, discovery data) from the last monitoring sweep
+        self._fingerprints = {}
         
     def sync_all_nodes(self, config_file_path: str) -> Dict[str, Any]:
         """
@@ -48,12 +52,16 @@ class ConfigMonitor:
         """
         logger.info("Starting cluster-wide configuration sync")
         
-        with open(config_file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_file_path)
         
         sync_results = {}
         updated_nodes = []
         
+        # Discover every enabled node at once; results are then applied in config order
+        discoveries = self._discover_nodes(
+            [n for n in config.get('nodes', []) if not self._is_node_disabled(n)]
+        )
+        
         for node_config in config.get('nodes', []):
             node_name = node_config.get('name')
             
@@ -67,11 +75,9 @@ class ConfigMonitor:
             
             try:
                 # Discover current state
-                discovery_data = self.discovery.discover_node_config(
-                    node_name,
-                    node_config.get('ssh_user', 'root'),
-                    node_config.get('tailscale_domain', f'{node_name}.ts.net')
-                )
+                discovery_data = discoveries[node_name]
+                if isinstance(discovery_data, Exception):
+                    raise discovery_data
                 
                 # Check for changes needed
                 changes_needed = self._analyze_changes_needed(node_config, discovery_data)
@@ -117,24 +123,22 @@ class ConfigMonitor:
         """Detect configuration drift across all nodes"""
         logger.info("Detecting configuration drift")
         
-        with open(config_file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_file_path)
         
         drift_detections = []
         
-        for node_config in config.get('nodes', []):
+        # Probe all enabled nodes at once so a sweep takes about one node's time
+        enabled_nodes = [n for n in config.get('nodes', []) if not self._is_node_disabled(n)]
+        live_states = self._discover_nodes(enabled_nodes, reuse_unchanged=True)
+        
+        for node_config in enabled_nodes:
             node_name = node_config.get('name')
             
-            if self._is_node_disabled(node_config):
-                continue
-            
             try:
                 # Get current live state
-                live_state = self.discovery.discover_node_config(
-                    node_name,
-                    node_config.get('ssh_user', 'root'),
-                    node_config.get('tailscale_domain', f'{node_name}.ts.net')
-                )
+                live_state = live_states[node_name]
+                if isinstance(live_state, Exception):
+                    raise live_state
                 
                 # Compare with config state
                 drift = self._compare_states(node_config, live_state)
@@ -162,8 +166,7 @@ class ConfigMonitor:
         """Refresh configuration for a single node"""
         logger.info(f"Refreshing configuration for node: {node_name}")
         
-        with open(config_file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_file_path)
         
         # Find the node
         node_config = None
@@ -222,6 +225,8 @@ class ConfigMonitor:
         
         while True:
             try:
+                sweep_started = time.monotonic()
+                
                 # Detect drift
                 drift = self.detect_drift(config_file_path)
                 
@@ -237,8 +242,8 @@ class ConfigMonitor:
                 else:
                     logger.info("No configuration drift detected")
                 
-                # Wait for next check
-                time.sleep(check_interval)
+                # Wait for next check; the sweep's own duration counts towards the interval
+                self._wait_for_next_sweep(config_file_path, sweep_started + check_interval)
                 
             except KeyboardInterrupt:
                 logger.info("Monitoring stopped by user")
@@ -247,6 +252,59 @@ class ConfigMonitor:
                 logger.error(f"Monitoring error: {e}")
                 time.sleep(60)  # Wait a bit before retrying
     
+    def _wait_for_next_sweep(self, config_file_path: str, deadline: float, poll_interval: float = 1.0):
+        """Sleep until the deadline, waking early if the config file is edited in the meantime"""
+        def config_mtime():
+            try:
+                return os.stat(config_file_path).st_mtime_ns
+            except OSError:
+                return None
+        
+        initial_mtime = config_mtime()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(poll_interval, remaining))
+            if config_mtime() != initial_mtime:
+                logger.info("Configuration file changed, checking for drift now")
+                return
+    
+    def _discover_nodes(self, node_configs: List[Dict], reuse_unchanged: bool = False) -> Dict[str, Any]:
+        """
+        Run live discovery for several nodes concurrently (each is an SSH round-trip)
+        
+        Args:
+            node_configs: Nodes to discover
+            reuse_unchanged: Reuse the previous discovery of nodes whose container
+                fingerprint hasn't changed since, instead of probing them in full
+            
+        Returns:
+            Dictionary mapping node name to its discovery data, or to the exception raised
+        """
+        def discover(node_config):
+            node_name = node_config.get('name')
+            ssh_user = node_config.get('ssh_user', 'root')
+            tailscale_domain = node_config.get('tailscale_domain', f'{node_name}.ts.net')
+            try:
+                fingerprint = None
+                if reuse_unchanged:
+                    fingerprint = self.discovery.node_fingerprint(ssh_user, tailscale_domain)
+                    cached = self._fingerprints.get(node_name)
+                    if fingerprint and cached and cached[0] == fingerprint:
+                        return cached[1]
+                discovery_data = self.discovery.discover_node_config(node_name, ssh_user, tailscale_domain)
+                if fingerprint:
+                    self._fingerprints[node_name] = (fingerprint, discovery_data)
+                return discovery_data
+            except Exception as e:
+                return e
+        
+        if not node_configs:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(32, len(node_configs))) as pool:
+            return dict(zip((n.get('name') for n in node_configs), pool.map(discover, node_configs)))
+    
     def _is_node_disabled(self, node_config: Dict) -> bool:
         """Check if a node is disabled"""
         return ('disabled' in node_config.get('stack', []) or 
@@ -394,8 +452,7 @@ class ConfigMonitor:
         
     def _save_config(self, config_file_path: str, config: Dict):
         """Save updated configuration"""
-        with open(config_file_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2, sort_keys=False)
+        save_config(config, config_file_path)
     
     def get_drift_history(self, hours: int = 24) -> List[DriftDetection]:
         """Get drift detection history for the last N hours"""
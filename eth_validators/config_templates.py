@@ -6,14 +6,20 @@ consistent node configurations across different setups and environments.
 """
 
 import logging
+import re
 import yaml
 import os
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from dataclasses import dataclass
 
+from .config import _YamlLoader, _YamlDumper
+
 logger = logging.getLogger(__name__)
 
+# {{variable}} or {{variable|default:value}}; names are anything up to the braces or '|'
+_TEMPLATE_VAR_RE = re.compile(r'\{\{([^{}|]+?)(?:\|default:(.*?))?\}\}')
+
 @dataclass
 class ConfigTemplate:
     """Represents a configuration template"""
@@ -297,27 +303,16 @@ class ConfigTemplateManager:
         if not isinstance(text, str):
             return text
         
-        result = text
-        
-        # Replace {{variable}} patterns
-        for var_name, var_value in variables.items():
-            pattern = f"{{{{{var_name}}}}}"
-            if pattern in result:
-                result = result.replace(pattern, str(var_value))
-        
-        # Handle default values {{variable|default:value}}
-        import re
-        default_pattern = r'\{\{(\w+)\|default:(.*?)\}\}'
-        matches = re.findall(default_pattern, result)
-        
-        for var_name, default_value in matches:
-            pattern = f"{{{{{var_name}|default:{default_value}}}}}"
+        def substitute(match):
+            var_name, default_value = match.groups()
             if var_name in variables:
-                result = result.replace(pattern, str(variables[var_name]))
-            else:
-                result = result.replace(pattern, default_value)
+                return str(variables[var_name])
+            if default_value is not None:
+                return default_value
+            return match.group(0)
         
-        return result
+        # Substitute provided variables and fall back to inline defaults in one pass
+        return _TEMPLATE_VAR_RE.sub(substitute, text)
     
     def _add_network_configurations(self, config: Dict[str, Any], networks: Dict[str, Any]) -> Dict[str, Any]:
         """Add network-specific configurations"""
@@ -357,7 +352,7 @@ class ConfigTemplateManager:
         }
         
         with open(template_file, 'w') as f:
-            yaml.dump(template_data, f, default_flow_style=False, indent=2)
+            yaml.dump(template_data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
     
     def export_template(self, template_name: str, output_file: str):
         """Export template to file"""
@@ -374,7 +369,7 @@ class ConfigTemplateManager:
         logger.info(f"Importing template from {template_file}")
         
         with open(template_file, 'r') as f:
-            template_data = yaml.safe_load(f)
+            template_data = yaml.load(f, Loader=_YamlLoader)
         
         template = ConfigTemplate(
             name=template_data["name"],
@@ -405,7 +400,7 @@ class ConfigTemplateManager:
         }
         
         with open(output_file, 'w') as f:
-            yaml.dump(template_data, f, default_flow_style=False, indent=2)
+            yaml.dump(template_data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
     
     def get_template_summary(self) -> Dict[str, Any]:
         """Get summary of all templates"""
@@ -446,12 +441,10 @@ class ConfigTemplateManager:
             return [f"Template {template_name} not found"]
         
         template = self.templates[template_name]
-        template_str = yaml.dump(template.template_data)
+        template_str = yaml.dump(template.template_data, Dumper=_YamlDumper)
         
         # Find all template variables
-        import re
-        variable_pattern = r'\{\{(\w+)(?:\|default:.*?)?\}\}'
-        required_vars = set(re.findall(variable_pattern, template_str))
+        required_vars = {var for var, _ in _TEMPLATE_VAR_RE.findall(template_str)}
         
         # Check for missing variables
         missing_vars = []
@@ -6,12 +6,13 @@ identifies issues, and provides auto-repair capabilities.
 """
 
 import logging
-import yaml
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterator, List, Tuple, Any, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import subprocess
 
 from .auto_discovery import AutoConfigDiscovery
+from .config import load_config, save_config
 from .smart_generator import SmartConfigGenerator
 
 logger = logging.getLogger(__name__)
@@ -57,27 +58,44 @@ class ConfigValidator:
         Returns:
             Tuple of (issues_found, repairs_performed)
         """
+        results = sorted(self.iter_validate_and_repair(config_file_path, auto_repair), key=lambda r: r[0])
+        issues = [issue for _, node_issues, _ in results for issue in node_issues]
+        repairs = [repair for _, _, node_repairs in results for repair in node_repairs]
+        
+        return issues, repairs
+    
+    def iter_validate_and_repair(self, config_file_path: str, auto_repair: bool = False) -> Iterator[Tuple[int, List[ValidationIssue], List[RepairAction]]]:
+        """
+        Validate nodes concurrently, yielding each node's results as it completes
+        
+        Nodes are yielded in completion order so callers can surface critical
+        issues without waiting for the slowest node; sort on the node index to
+        get back to config order. Repairs are saved once the last node has
+        been yielded.
+        
+        Yields:
+            Tuple of (node_index, node_issues, node_repairs) per node
+        """
         logger.info(f"Validating configuration: {config_file_path}")
         
         # Load current configuration
-        with open(config_file_path, 'r') as f:
-            config = yaml.safe_load(f)
-            
-        issues = []
-        repairs = []
+        config = load_config(config_file_path)
+        nodes = config.get('nodes', [])
+        repaired = 0
         
-        # Validate each node
-        for node_config in config.get('nodes', []):
-            node_issues, node_repairs = self._validate_node(node_config, auto_repair)
-            issues.extend(node_issues)
-            repairs.extend(node_repairs)
+        if nodes:
+            with ThreadPoolExecutor(max_workers=min(32, len(nodes))) as pool:
+                futures = {pool.submit(self._validate_node, node_config, auto_repair): index
+                           for index, node_config in enumerate(nodes)}
+                for future in as_completed(futures):
+                    node_issues, node_repairs = future.result()
+                    repaired += len(node_repairs)
+                    yield futures[future], node_issues, node_repairs
         
         # Save updated configuration if repairs were made
-        if repairs and auto_repair:
+        if repaired and auto_repair:
             self._save_config(config_file_path, config)
-            logger.info(f"Configuration updated with {len(repairs)} repairs")
-        
-        return issues, repairs
+            logger.info(f"Configuration updated with {repaired} repairs")
     
     def _validate_node(self, node_config: Dict, auto_repair: bool = False) -> Tuple[List[ValidationIssue], List[RepairAction]]:
         """Validate a single node configuration"""
@@ -337,8 +355,7 @@ class ConfigValidator:
     def _save_config(self, config_file_path: str, config: Dict):
         """Save updated configuration to file"""
         try:
-            with open(config_file_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2, sort_keys=False)
+            save_config(config, config_file_path)
             logger.info(f"Configuration saved: {config_file_path}")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -346,8 +363,7 @@ class ConfigValidator:
     
     def validate_single_node(self, node_name: str, config_file_path: str) -> List[ValidationIssue]:
         """Validate a single node without making repairs"""
-        with open(config_file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_file_path)
             
         for node_config in config.get('nodes', []):
             if node_config.get('name') == node_name:
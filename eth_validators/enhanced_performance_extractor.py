@@ -10,8 +10,10 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-import yaml
 import logging
+from collections import Counter, defaultdict
+from functools import lru_cache
+from .config import load_config
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,18 @@ def get_config_path():
     default_config = Path(__file__).parent / 'config.yaml'
     return default_config
 
+@lru_cache(maxsize=1)
+def _validator_indices_by_domain(csv_path: str, mtime_ns: int) -> Dict[str, List[int]]:
+    """Index the validators CSV by tailscale domain; keyed by mtime so edits are picked up"""
+    import csv
+    indices = defaultdict(list)
+    with open(csv_path, 'r') as f:
+        for row in csv.DictReader(f):
+            index = row.get('validator index', '').strip()
+            if index and index.isdigit():
+                indices[row.get('tailscale dns', '').strip()].append(int(index))
+    return dict(indices)
+
 class ValidatorPerformanceExtractor:
     """Enhanced extractor for comprehensive validator performance data"""
     
@@ -36,8 +50,7 @@ class ValidatorPerformanceExtractor:
     def load_config(self):
         """Load node configuration"""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = load_config(self.config_path)
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             self.config = {'nodes': []}
@@ -127,15 +140,8 @@ class ValidatorPerformanceExtractor:
                 peers_data = peers_resp.json().get('data', [])
                 
                 # Analyze peer distribution
-                peer_states = {}
-                peer_directions = {}
-                
-                for peer in peers_data:
-                    state = peer.get('state', 'unknown')
-                    direction = peer.get('direction', 'unknown')
-                    
-                    peer_states[state] = peer_states.get(state, 0) + 1
-                    peer_directions[direction] = peer_directions.get(direction, 0) + 1
+                peer_states = Counter(peer.get('state', 'unknown') for peer in peers_data)
+                peer_directions = Counter(peer.get('direction', 'unknown') for peer in peers_data)
                 
                 return {
                     'total_peers': len(peers_data),
@@ -154,18 +160,21 @@ class ValidatorPerformanceExtractor:
         """Get comprehensive validator performance metrics"""
         try:
             validator_metrics = {}
+            states = self._get_validator_states(api_url, validator_indices)
             
             for index in validator_indices:
                 try:
-                    # Get validator status and details
-                    validator_resp = requests.get(
-                        f"{api_url}/eth/v1/beacon/states/head/validators/{index}", 
-                        timeout=10
-                    )
+                    # Get validator status and details, from the batch lookup when it worked
+                    validator_data = states.get(str(index))
+                    if validator_data is None:
+                        validator_resp = requests.get(
+                            f"{api_url}/eth/v1/beacon/states/head/validators/{index}", 
+                            timeout=10
+                        )
+                        if validator_resp.status_code == 200:
+                            validator_data = validator_resp.json().get('data', {})
                     
-                    if validator_resp.status_code == 200:
-                        validator_data = validator_resp.json().get('data', {})
-                        
+                    if validator_data is not None:
                         # Extract validator information
                         validator_info = {
                             'index': index,
@@ -196,6 +205,22 @@ class ValidatorPerformanceExtractor:
         except Exception as e:
             return {'error': str(e)}
     
+    def _get_validator_states(self, api_url: str, validator_indices: List[int]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the head state of several validators in one request, keyed by index (empty on failure)"""
+        if not validator_indices:
+            return {}
+        try:
+            resp = requests.get(
+                f"{api_url}/eth/v1/beacon/states/head/validators",
+                params={'id': ','.join(str(index) for index in validator_indices)},
+                timeout=10
+            )
+            if resp.status_code == 200:
+                return {str(entry.get('index')): entry for entry in resp.json().get('data', [])}
+        except Exception as e:
+            logger.warning(f"Batch validator lookup failed, falling back to per-validator requests: {e}")
+        return {}
+    
     def _get_client_specific_performance(self, api_url: str, index: int) -> Optional[Dict[str, Any]]:
         """Get client-specific performance metrics (Lighthouse, Teku, etc.)"""
         # Try Lighthouse API
@@ -667,18 +692,8 @@ class ValidatorPerformanceExtractor:
             if not validators_path.exists():
                 return []
             
-            import csv
-            validator_indices = []
-            
-            with open(validators_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('tailscale dns', '').strip() == self._get_node_domain(node_name):
-                        index = row.get('validator index', '').strip()
-                        if index and index.isdigit():
-                            validator_indices.append(int(index))
-            
-            return validator_indices
+            by_domain = _validator_indices_by_domain(str(validators_path), validators_path.stat().st_mtime_ns)
+            return list(by_domain.get(self._get_node_domain(node_name), []))
             
         except Exception:
             return []
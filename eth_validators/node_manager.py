@@ -3,11 +3,35 @@ Handles direct interaction with a node, including SSH commands and API calls
 for status, versioning, and synchronization checks.
 """
 import subprocess
-import requests
 import json
 import socket
 import time
 import re
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# SSH connection sharing: the first ssh to a host opens a master connection and later
+# commands within ControlPersist reuse it instead of redoing the TCP/key exchange/auth.
+# Set ETH_MANAGER_SSH_MUX=0 to turn it off (e.g. if ~/.ssh is read-only).
+_SSH_MUX_OPTIONS = None
+
+def _ssh_mux_options():
+    """Return the ssh -o flags enabling ControlMaster multiplexing, or '' if unavailable"""
+    global _SSH_MUX_OPTIONS
+    if _SSH_MUX_OPTIONS is None:
+        _SSH_MUX_OPTIONS = ""
+        if os.environ.get('ETH_MANAGER_SSH_MUX', '1') != '0':
+            ssh_dir = Path.home() / '.ssh'
+            try:
+                ssh_dir.mkdir(mode=0o700, exist_ok=True)
+                if os.access(ssh_dir, os.W_OK):
+                    # %C is a hash of user/host/port, which keeps the socket path short
+                    _SSH_MUX_OPTIONS = f"-o ControlMaster=auto -o ControlPath={ssh_dir}/cm-%C -o ControlPersist=60s "
+            except OSError:
+                pass
+    return _SSH_MUX_OPTIONS
 
 def _is_stack_disabled(stack):
     """Check if stack is disabled - supports both string and list format"""
@@ -23,11 +47,36 @@ def _get_free_port():
         return s.getsockname()[1]
 
 
+def _wait_for_tunnels(ports, procs, timeout=10):
+    """
+    Waits until the local ends of SSH port forwards accept connections, polling with
+    backoff instead of sleeping a fixed amount. Returns early if a tunnel process exits.
+    """
+    deadline = time.time() + timeout
+    pending = list(ports)
+    delay = 0.05
+    while pending and time.time() < deadline:
+        if any(proc.poll() is not None for proc in procs):
+            return
+        still_pending = []
+        for port in pending:
+            try:
+                with socket.create_connection(('localhost', port), timeout=0.5):
+                    pass
+            except OSError:
+                still_pending.append(port)
+        pending = still_pending
+        if pending:
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
 def _get_execution_sync_status(api_url):
     """
     Checks the execution client sync status via JSON-RPC.
     Returns 'Synced', 'Syncing', or 'Error'.
     """
+    import requests  # deferred: only sync checks and release lookups need it
+    
     headers = {'Content-Type': 'application/json'}
     payload = json.dumps({"jsonrpc":"2.0", "method":"eth_syncing", "params":[], "id":1})
     try:
@@ -47,6 +96,8 @@ def _get_consensus_sync_status(api_url):
     Checks the consensus client sync status via Beacon API.
     Returns 'Synced', 'Syncing', or 'Error'.
     """
+    import requests
+    
     try:
         response = requests.get(f"{api_url}/eth/v1/node/syncing", timeout=5)
         if response.status_code == 200:
@@ -66,7 +117,7 @@ def get_node_status(node_config):
 
     # 1. Get docker ps output
     try:
-        docker_ps_cmd = ['ssh', ssh_target, 'docker', 'ps', '--format', 'table {{.Names}}\\t{{.Image}}\\t{{.Status}}']
+        docker_ps_cmd = ['ssh', *_ssh_mux_options().split(), ssh_target, 'docker', 'ps', '--format', 'table {{.Names}}\\t{{.Image}}\\t{{.Status}}']
         process = subprocess.run(docker_ps_cmd, capture_output=True, text=True, check=True, timeout=15)
         results['docker_ps'] = process.stdout.strip()
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
@@ -81,7 +132,7 @@ def get_node_status(node_config):
 
     el_proc = subprocess.Popen(el_tunnel_cmd)
     cl_proc = subprocess.Popen(cl_tunnel_cmd)
-    time.sleep(3) # Give tunnels time to establish
+    _wait_for_tunnels([el_port, cl_port], [el_proc, cl_proc])
 
     try:
         # 3. Get sync status
@@ -118,8 +169,6 @@ def _validate_ethd_exists(eth_docker_path, is_local=False, ssh_target=None):
     Returns:
         Tuple of (exists: bool, error_message: str or None)
     """
-    import os
-
     if is_local:
         ethd_path = os.path.join(eth_docker_path, 'ethd')
         if not os.path.exists(ethd_path):
@@ -128,7 +177,7 @@ def _validate_ethd_exists(eth_docker_path, is_local=False, ssh_target=None):
             return False, f"ethd not executable at {ethd_path}"
         return True, None
     else:
-        check_cmd = f'ssh {ssh_target} "test -x {eth_docker_path}/ethd"'
+        check_cmd = f'ssh {_ssh_mux_options()}{ssh_target} "test -x {eth_docker_path}/ethd"'
         result = subprocess.run(check_cmd, shell=True, capture_output=True)
         if result.returncode != 0:
             return False, f"ethd not found or not executable at {eth_docker_path}/ethd"
@@ -164,7 +213,7 @@ def _upgrade_single_network_node(node_config):
         upgrade_cmd = f'cd {eth_docker_path} && ./ethd update --non-interactive'
     else:
         # Execute via SSH - use ethd update
-        upgrade_cmd = f'ssh {ssh_target} "cd {eth_docker_path} && ./ethd update --non-interactive"'
+        upgrade_cmd = f'ssh {_ssh_mux_options()}{ssh_target} "cd {eth_docker_path} && ./ethd update --non-interactive"'
 
     try:
         process = subprocess.run(upgrade_cmd, shell=True, capture_output=True, text=True, timeout=600)
@@ -223,7 +272,7 @@ def _upgrade_multi_network_node(node_config):
                 network_result['upgrade_success'] = process.returncode == 0
             else:
                 # Execute via SSH
-                full_cmd = f'ssh {ssh_target} "cd {eth_docker_path} && {ethd_update_cmd}"'
+                full_cmd = f'ssh {_ssh_mux_options()}{ssh_target} "cd {eth_docker_path} && {ethd_update_cmd}"'
                 process = subprocess.run(full_cmd, shell=True, capture_output=True, text=True, timeout=600)
                 network_result['upgrade_output'] = process.stdout
                 network_result['upgrade_error'] = process.stderr
@@ -301,7 +350,7 @@ def _cleanup_stuck_apt_processes(node_config):
         cmd = cleanup_cmd
     else:
         ssh_target = f"{ssh_user}@{node_config['tailscale_domain']}"
-        cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{cleanup_cmd}'"
+        cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{cleanup_cmd}'"
     
     try:
         subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
@@ -319,6 +368,9 @@ def get_system_update_status(node_config):
     Supports both local and remote nodes.
     
     Includes automatic cleanup of stuck APT processes to prevent lock issues.
+    
+    The same round trip also reports whether /var/run/reboot-required exists,
+    as 'reboot_required' (omitted if the command didn't run).
     """
     # Clean up any stuck APT processes first
     _cleanup_stuck_apt_processes(node_config)
@@ -327,30 +379,36 @@ def get_system_update_status(node_config):
     ssh_user = node_config.get('ssh_user', 'root')
     is_local = node_config.get('is_local', False)
     
+    # Appended to the apt check so one round trip answers both; keeps the apt exit status
+    reboot_check_cmd = 'rc=$?; if [ -f /var/run/reboot-required ]; then echo REBOOT_REQUIRED; else echo NO_REBOOT; fi; exit $rc'
+    
     # Primary method: Wait for APT locks to be released, then check updates with proper timeout
     if ssh_user == 'root':
         # Wait for locks (max 30 seconds), then run apt commands with timeout protection
         apt_wait_cmd = 'timeout=30; while [ $timeout -gt 0 ] && (fuser /var/lib/dpkg/lock-frontend >/dev/null 2>&1 || fuser /var/lib/apt/lists/lock >/dev/null 2>&1); do sleep 2; timeout=$((timeout-2)); done'
         apt_check_cmd = 'if [ $timeout -gt 0 ]; then timeout 45 apt update >/dev/null 2>&1 && timeout 15 apt upgrade -s 2>/dev/null | grep "^Inst " | wc -l; else echo "FALLBACK"; fi'
-        full_cmd = f'{apt_wait_cmd}; {apt_check_cmd}'
+        full_cmd = f'{apt_wait_cmd}; {apt_check_cmd}; {reboot_check_cmd}'
     else:
         # Wait for locks (max 30 seconds), then run apt commands with timeout protection
         apt_wait_cmd = 'timeout=30; while [ $timeout -gt 0 ] && (sudo fuser /var/lib/dpkg/lock-frontend >/dev/null 2>&1 || sudo fuser /var/lib/apt/lists/lock >/dev/null 2>&1); do sleep 2; timeout=$((timeout-2)); done'
         apt_check_cmd = 'if [ $timeout -gt 0 ]; then timeout 45 sudo apt update >/dev/null 2>&1 && timeout 15 sudo apt upgrade -s 2>/dev/null | grep "^Inst " | wc -l; else echo "FALLBACK"; fi'
-        full_cmd = f'{apt_wait_cmd}; {apt_check_cmd}'
+        full_cmd = f'{apt_wait_cmd}; {apt_check_cmd}; {reboot_check_cmd}'
     
     # Execute command locally or via SSH
     if is_local:
         check_cmd = full_cmd
     else:
         ssh_target = f"{ssh_user}@{node_config['tailscale_domain']}"
-        check_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{full_cmd}'"
+        check_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{full_cmd}'"
     
     try:
         # Increase timeout to accommodate the new timeout commands (45s apt update + 15s upgrade check + 30s wait)
         process = subprocess.run(check_cmd, shell=True, capture_output=True, text=True, timeout=120)
+        output_lines = process.stdout.strip().splitlines()
+        if output_lines and output_lines[-1] in ('REBOOT_REQUIRED', 'NO_REBOOT'):
+            results['reboot_required'] = output_lines.pop() == 'REBOOT_REQUIRED'
         if process.returncode == 0:
-            output = process.stdout.strip()
+            output = '\n'.join(output_lines).strip()
             
             # Check if we need to use fallback method
             if output == "FALLBACK":
@@ -363,9 +421,9 @@ def get_system_update_status(node_config):
                         fallback_cmd = 'sudo /usr/lib/update-notifier/apt-check 2>&1'
                 else:
                     ssh_target = f"{ssh_user}@{node_config['tailscale_domain']}"
-                    fallback_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '/usr/lib/update-notifier/apt-check 2>&1'"
+                    fallback_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '/usr/lib/update-notifier/apt-check 2>&1'"
                     if ssh_user != 'root':
-                        fallback_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} 'sudo /usr/lib/update-notifier/apt-check 2>&1'"
+                        fallback_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} 'sudo /usr/lib/update-notifier/apt-check 2>&1'"
                 
                 fallback_process = subprocess.run(fallback_cmd, shell=True, capture_output=True, text=True, timeout=15)
                 if fallback_process.returncode == 0:
@@ -441,7 +499,7 @@ def perform_system_upgrade(node_config):
         upgrade_cmd = full_cmd
     else:
         ssh_target = f"{ssh_user}@{node_config['tailscale_domain']}"
-        upgrade_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{full_cmd}'"
+        upgrade_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{full_cmd}'"
     
     try:
         process = subprocess.run(upgrade_cmd, shell=True, capture_output=True, text=True, timeout=900)  # 15 minute timeout
@@ -505,9 +563,9 @@ def _get_multi_network_client_versions(node_config):
             container_prefix = network_config.get('container_prefix', 'eth-docker')
             
             if ssh_target is None:
-                containers_cmd = f"docker ps --format '{{{{.Names}}}}:{{{{.Image}}}}' | grep '{container_prefix}' 2>/dev/null || echo 'No containers'"
+                containers_cmd = f"docker ps --filter name={container_prefix} --format '{{{{.Names}}}}:{{{{.Image}}}}'"
             else:
-                containers_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} 'docker ps --format \"{{{{.Names}}}}:{{{{.Image}}}}\" | grep \"{container_prefix}\" 2>/dev/null || echo \"No containers\"'"
+                containers_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} 'docker ps --filter name={container_prefix} --format \"{{{{.Names}}}}:{{{{.Image}}}}\"'"
             
             containers_process = subprocess.run(containers_cmd, shell=True, capture_output=True, text=True, timeout=10)
             
@@ -528,7 +586,8 @@ def _get_multi_network_client_versions(node_config):
                 'needs_client_update': False
             }
             
-            if containers_process.returncode == 0 and "No containers" not in containers_process.stdout:
+            # docker does the name matching; an empty listing just yields no lines below
+            if containers_process.returncode == 0:
                 container_lines = containers_process.stdout.strip().split('\n')
                 
                 for line in container_lines:
@@ -638,7 +697,7 @@ def _get_single_network_client_versions(node_config):
             containers_cmd = "docker ps --format '{{.Names}}:{{.Image}}' 2>/dev/null || echo 'Error'"
         else:
             # Remote execution via SSH
-            containers_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} 'docker ps --format \"{{{{.Names}}}}:{{{{.Image}}}}\" 2>/dev/null || echo \"Error\"'"
+            containers_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} 'docker ps --format \"{{{{.Names}}}}:{{{{.Image}}}}\" 2>/dev/null || echo \"Error\"'"
             
         containers_process = subprocess.run(containers_cmd, shell=True, capture_output=True, text=True, timeout=10)
         
@@ -919,7 +978,7 @@ def _get_version_via_docker_exec(ssh_target, container_name, client_name):
             exec_process = subprocess.run(docker_exec_cmd, shell=True, capture_output=True, text=True, timeout=10)
         else:
             # Remote execution via SSH
-            exec_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{docker_exec_cmd}'"
+            exec_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{docker_exec_cmd}'"
             exec_process = subprocess.run(exec_cmd, shell=True, capture_output=True, text=True, timeout=10)
         
         if exec_process.returncode == 0:
@@ -953,7 +1012,7 @@ def _get_lodestar_version_from_container(ssh_target, container_name):
     try:
         # Try the Lodestar-specific version command first
         lodestar_cmd = f"docker exec {container_name} /usr/app/node_modules/.bin/lodestar --version 2>/dev/null"
-        full_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{lodestar_cmd}'"
+        full_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{lodestar_cmd}'"
         result = subprocess.run(full_cmd, shell=True, capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0 and result.stdout.strip():
@@ -971,7 +1030,7 @@ def _get_lodestar_version_from_container(ssh_target, container_name):
         ]
         
         for cmd in fallback_commands:
-            full_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{cmd}'"
+            full_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{cmd}'"
             result = subprocess.run(full_cmd, shell=True, capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0 and result.stdout.strip():
@@ -1007,7 +1066,7 @@ def _get_caplin_version_from_api(ssh_target, node_config):
             api_cmd = f"curl -s --connect-timeout 5 --max-time 10 http://localhost:{beacon_api_port}/eth/v1/node/version"
         else:
             # Remote execution via SSH
-            api_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} \"curl -s --connect-timeout 5 --max-time 10 http://localhost:{beacon_api_port}/eth/v1/node/version\""
+            api_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} \"curl -s --connect-timeout 5 --max-time 10 http://localhost:{beacon_api_port}/eth/v1/node/version\""
         
         result = subprocess.run(api_cmd, shell=True, capture_output=True, text=True, timeout=15)
         
@@ -1049,7 +1108,7 @@ def _get_vero_version_from_container(ssh_target, container_name):
     try:
         # Try to get version from container environment (GIT_TAG) - using simpler approach
         env_cmd = f"docker inspect {container_name} -f '{{{{range .Config.Env}}}}{{{{println .}}}}{{{{end}}}}' | grep GIT_TAG"
-        full_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} \"{env_cmd}\""
+        full_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} \"{env_cmd}\""
         result = subprocess.run(full_cmd, shell=True, capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0 and result.stdout.strip():
@@ -1083,7 +1142,7 @@ def _get_client_version_from_logs(ssh_target, container_name, client_name):
             logs_cmd = f"docker logs --tail 100 {container_name} 2>&1"
         else:
             # Remote execution via SSH
-            logs_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} 'docker logs --tail 100 {container_name} 2>&1'"
+            logs_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} 'docker logs --tail 100 {container_name} 2>&1'"
             
         logs_process = subprocess.run(logs_cmd, shell=True, capture_output=True, text=True, timeout=15)
         
@@ -1098,7 +1157,7 @@ def _get_client_version_from_logs(ssh_target, container_name, client_name):
                 head_cmd = f"docker logs {container_name} 2>&1 | head -50"
             else:
                 # Remote execution via SSH
-                head_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} 'docker logs {container_name} 2>&1 | head -50'"
+                head_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} 'docker logs {container_name} 2>&1 | head -50'"
                 
             head_process = subprocess.run(head_cmd, shell=True, capture_output=True, text=True, timeout=15)
             if head_process.returncode == 0:
@@ -1299,21 +1358,99 @@ def _identify_client_from_image(image, client_type):
     
     return "Unknown"
 
+# One lock per client so that nodes checked concurrently wait for a single GitHub
+# request per client instead of all missing the cache and fetching it at once.
+_release_locks = {}
+_release_locks_guard = threading.Lock()
+
+# Successful release lookups are also kept on disk, so back-to-back CLI runs
+# reuse them instead of spending the unauthenticated GitHub rate limit again.
+_RELEASE_CACHE_FILE = Path.home() / '.cache' / 'eth_validators' / 'github_latest.json'
+
+# Guards changes to the in-memory release cache against the snapshot taken for saving;
+# lookups for different clients run concurrently under their own per-client locks.
+_release_cache_lock = threading.Lock()
+
+def _load_release_cache():
+    """Load the on-disk release cache, ignoring a missing or unreadable file and malformed entries"""
+    try:
+        with open(_RELEASE_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        name: data for name, data in cache.items()
+        if isinstance(data, dict)
+        and isinstance(data.get('version'), str)
+        and isinstance(data.get('timestamp'), (int, float))
+    }
+
+def _save_release_cache(cache):
+    """Write successful release lookups back to disk (best effort)"""
+    with _release_cache_lock:
+        entries = {name: dict(data) for name, data in cache.items() if 'ttl' not in data}
+        tmp_path = None
+        try:
+            _RELEASE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # A private temp file in the same directory, so the rename is atomic
+            fd, tmp_path = tempfile.mkstemp(dir=_RELEASE_CACHE_FILE.parent, prefix='.github_latest.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, _RELEASE_CACHE_FILE)
+        except OSError:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+# Shared HTTPS session for GitHub: lookups for different clients reuse one pooled
+# keep-alive connection instead of a fresh TCP+TLS handshake each. GITHUB_TOKEN,
+# if set, raises the rate limit from 60 to 5000 requests an hour.
+_github_session = None
+_github_session_guard = threading.Lock()
+
+def _get_github_session():
+    """Return the shared GitHub requests.Session, creating it on first use"""
+    global _github_session
+    with _github_session_guard:
+        if _github_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16))
+            session.headers['Accept'] = 'application/vnd.github+json'
+            token = os.environ.get('GITHUB_TOKEN')
+            if token:
+                session.headers['Authorization'] = f"Bearer {token}"
+            _github_session = session
+        return _github_session
+
 def _get_latest_github_release(client_name):
     """
     Gets the latest release version from GitHub for a specific Ethereum client.
     Implements caching and rate limiting awareness.
     """
-    # Cache to avoid repeated API calls within the same session
-    if not hasattr(_get_latest_github_release, 'cache'):
-        _get_latest_github_release.cache = {}
-        _get_latest_github_release.last_reset_check = 0
+    with _release_locks_guard:
+        # Cache to avoid repeated API calls within the same session
+        if not hasattr(_get_latest_github_release, 'cache'):
+            _get_latest_github_release.cache = _load_release_cache()
+            _get_latest_github_release.last_reset_check = 0
+        lock = _release_locks.setdefault(client_name, threading.Lock())
     
+    with lock:
+        return _lookup_latest_github_release(client_name)
+
+def _lookup_latest_github_release(client_name):
+    """Cache lookup and GitHub fetch behind _get_latest_github_release's per-client lock"""
     # Check cache first
     if client_name in _get_latest_github_release.cache:
         cached_data = _get_latest_github_release.cache[client_name]
-        # Cache is valid for 10 minutes
-        if time.time() - cached_data['timestamp'] < 600:
+        # Cache is valid for 10 minutes (failed lookups only for a minute)
+        if time.time() - cached_data['timestamp'] < cached_data.get('ttl', 600):
             return cached_data['version']
     
     # GitHub repositories mapping
@@ -1330,7 +1467,8 @@ def _get_latest_github_release(client_name):
         'nimbus': 'status-im/nimbus-eth2',
         'lodestar': 'ChainSafe/lodestar',
         'grandine': 'grandinetech/grandine',
-        'vero': 'serenita-org/vero'  # Vero validator client from Serenita
+        'vero': 'serenita-org/vero',  # Vero validator client from Serenita
+        'charon': 'ObolNetwork/charon'
     }
     
     if client_name not in github_repos:
@@ -1339,20 +1477,32 @@ def _get_latest_github_release(client_name):
     repo = github_repos[client_name]
     api_url = f"https://api.github.com/repos/{repo}/releases/latest"
     
+    # An expired entry can still be revalidated: a 304 reply doesn't count against the rate limit
+    cached_data = _get_latest_github_release.cache.get(client_name, {})
+    headers = {'If-None-Match': cached_data['etag']} if cached_data.get('etag') else {}
+    
     try:
-        response = requests.get(api_url, timeout=10)
+        response = _get_github_session().get(api_url, headers=headers, timeout=10)
         
-        if response.status_code == 200:
+        if response.status_code == 304:
+            with _release_cache_lock:
+                cached_data['timestamp'] = time.time()
+            _save_release_cache(_get_latest_github_release.cache)
+            return cached_data['version']
+        elif response.status_code == 200:
             release_data = response.json()
             tag_name = release_data.get('tag_name', '')
             # Clean version tag (remove 'v' prefix if present)
             version = tag_name.lstrip('v')
             
             # Cache the result
-            _get_latest_github_release.cache[client_name] = {
-                'version': version,
-                'timestamp': time.time()
-            }
+            with _release_cache_lock:
+                _get_latest_github_release.cache[client_name] = {
+                    'version': version,
+                    'timestamp': time.time(),
+                    'etag': response.headers.get('ETag')
+                }
+            _save_release_cache(_get_latest_github_release.cache)
             
             return version
         elif response.status_code == 403:
@@ -1360,14 +1510,30 @@ def _get_latest_github_release(client_name):
             if client_name in _get_latest_github_release.cache:
                 return _get_latest_github_release.cache[client_name]['version']
             else:
-                return "Rate Limited"
+                return _cache_release_failure(client_name, "Rate Limited")
         else:
-            return "API Error"
+            # Keep serving the last good version (and keep its ETag) through transient errors
+            if 'ttl' not in cached_data and 'version' in cached_data:
+                return cached_data['version']
+            return _cache_release_failure(client_name, "API Error")
     except Exception as e:
         # If we have a cached version, return it during network errors
         if client_name in _get_latest_github_release.cache:
             return _get_latest_github_release.cache[client_name]['version']
-        return "Network Error"
+        return _cache_release_failure(client_name, "Network Error")
+
+def _cache_release_failure(client_name, status):
+    """
+    Remember a failed release lookup for a minute so that every other node running the
+    same client doesn't hit GitHub again (and burn more of the rate limit) in the same run.
+    """
+    with _release_cache_lock:
+        _get_latest_github_release.cache[client_name] = {
+            'version': status,
+            'timestamp': time.time(),
+            'ttl': 60
+        }
+    return status
 
 def _version_needs_update(current_version, latest_version):
     """
@@ -1533,6 +1699,9 @@ def get_node_port_mappings(node_config, source: str = "both"):
         'errors': [str,...]
       }
 
+    Ports are parsed to ints (None when absent) and proto is lower-case, so callers
+    can compare them directly.
+
     source: 'docker' | 'env' | 'both'
     """
     name = node_config.get('name')
@@ -1547,7 +1716,7 @@ def get_node_port_mappings(node_config, source: str = "both"):
                 return subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout, cwd=cwd)
             else:
                 # Wrap remote command
-                return subprocess.run(f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{cmd}'", shell=True, capture_output=True, text=True, timeout=timeout)
+                return subprocess.run(f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{cmd}'", shell=True, capture_output=True, text=True, timeout=timeout)
         except Exception as e:
             class R:
                 pass
@@ -1588,7 +1757,7 @@ def get_node_port_mappings(node_config, source: str = "both"):
             'container': container,
             'host_port': hp,
             'container_port': cp,
-            'proto': proto or 'tcp',
+            'proto': (proto or 'tcp').lower(),
             'source': src,
             'network': network or '-',
             'published': bool(published) if published is not None else (hp is not None)
@@ -1863,10 +2032,9 @@ def run_command_on_node(node_name, command, timeout=10):
         Command output as string, or None if failed
     """
     import subprocess
-    import yaml
     try:
-        from eth_validators.config import get_config_path
-        config = yaml.safe_load(get_config_path().read_text())
+        from eth_validators.config import load_config
+        config = load_config()
         
         # Find the node config
         node_config = None
@@ -1885,7 +2053,7 @@ def run_command_on_node(node_name, command, timeout=10):
             result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=timeout)
         else:
             ssh_target = f"{ssh_user}@{node_config['tailscale_domain']}"
-            ssh_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {ssh_target} '{command}'"
+            ssh_cmd = f"ssh -o BatchMode=yes -o ConnectTimeout=10 {_ssh_mux_options()}{ssh_target} '{command}'"
             result = subprocess.run(ssh_cmd, shell=True, capture_output=True, text=True, timeout=timeout)
         
         if result.returncode == 0:
@@ -1914,7 +2082,7 @@ def get_env_p2p_ports(node_config):
         else:
             ssh_user = node_config.get('ssh_user', 'root')
             tailscale_domain = node_config.get('tailscale_domain')
-            result = subprocess.run(f"ssh {ssh_user}@{tailscale_domain} 'cat {eth_docker_path}/.env'", 
+            result = subprocess.run(f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} 'cat {eth_docker_path}/.env'", 
                                   shell=True, capture_output=True, text=True, timeout=10)
             if result.returncode != 0:
                 return p2p_ports
@@ -1954,6 +2122,7 @@ def get_compose_p2p_ports(node_config):
     """Extract P2P ports from docker-compose.yml port mappings"""
     import re
     import yaml
+    from .config import _YamlLoader
     
     name = node_config.get('name')
     is_local = node_config.get('is_local', False)
@@ -1978,7 +2147,7 @@ def get_compose_p2p_ports(node_config):
         else:
             ssh_user = node_config.get('ssh_user', 'root')
             tailscale_domain = node_config.get('tailscale_domain')
-            result = subprocess.run(f"ssh {ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && grep COMPOSE_FILE .env'", 
+            result = subprocess.run(f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} 'cd {eth_docker_path} && grep COMPOSE_FILE .env'", 
                                   shell=True, capture_output=True, text=True, timeout=10)
             if result.returncode == 0 and result.stdout.strip():
                 compose_file_value = result.stdout.strip().split('=', 1)[1]
@@ -1991,13 +2160,13 @@ def get_compose_p2p_ports(node_config):
             try:
                 if is_local:
                     with open(f"{eth_docker_path}/{compose_file}", 'r') as f:
-                        compose_data = yaml.safe_load(f)
+                        compose_data = yaml.load(f, Loader=_YamlLoader)
                 else:
-                    result = subprocess.run(f"ssh {ssh_user}@{tailscale_domain} 'cat {eth_docker_path}/{compose_file}'", 
+                    result = subprocess.run(f"ssh {_ssh_mux_options()}{ssh_user}@{tailscale_domain} 'cat {eth_docker_path}/{compose_file}'", 
                                           shell=True, capture_output=True, text=True, timeout=10)
                     if result.returncode != 0:
                         continue
-                    compose_data = yaml.safe_load(result.stdout)
+                    compose_data = yaml.load(result.stdout, Loader=_YamlLoader)
                 
                 if not compose_data or 'services' not in compose_data:
                     continue
@@ -5,13 +5,13 @@ the official validator status and then querying performance from multiple client
 """
 import csv
 import requests
-import yaml
 from pathlib import Path
 import subprocess
 import socket
 import time
 import json
 import random
+from .config import load_config
 
 def get_config_path():
     """Find config.yaml in current directory first, then in eth_validators directory"""
@@ -138,6 +138,13 @@ def _get_teku_performance(api_url, index):
     except requests.RequestException:
         return None
 
+def _read_validators_csv(path):
+    """Read the validators CSV into a list of dicts, with header names stripped of padding"""
+    with open(path, mode='r', newline='', encoding='utf-8') as infile:
+        reader = csv.DictReader(infile)
+        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+        return list(reader)
+
 def get_performance_summary():
     """
     Selects one validator per node and queries its status and performance
@@ -145,8 +152,7 @@ def get_performance_summary():
     """
     # --- Step 1: Ler configs e selecionar validadores ---
     try:
-        with open(get_config_path(), 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(get_config_path())
         nodes_from_config = config.get('nodes', [])
     except (FileNotFoundError, Exception) as e:
         return [["Error", f"Failed to process config.yaml: {e}", "", "", "", ""]]
@@ -161,18 +167,12 @@ def get_performance_summary():
         all_validators = get_active_validators_only()
         if not all_validators:
             # Fallback to loading all validators if active filter fails
-            with open(VALIDATORS_PATH, mode='r', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                reader.fieldnames = [name.strip() for name in reader.fieldnames]
-                all_validators = list(reader)
+            all_validators = _read_validators_csv(VALIDATORS_PATH)
         
     except (FileNotFoundError, ImportError, Exception) as e:
         # Fallback to original CSV loading
         try:
-            with open(VALIDATORS_PATH, mode='r', encoding='utf-8') as infile:
-                reader = csv.DictReader(infile)
-                reader.fieldnames = [name.strip() for name in reader.fieldnames]
-                all_validators = list(reader)
+            all_validators = _read_validators_csv(VALIDATORS_PATH)
         except Exception as fallback_e:
             return [["Error", f"Failed to process validators vs hardware.csv: {fallback_e}", "", "", "", ""]]
 
@@ -12,6 +12,8 @@ import click
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .config import _YamlDumper
+
 logger = logging.getLogger(__name__)
 
 def _run_command(node_cfg, command):
@@ -327,8 +329,11 @@ class SimpleSetupWizard:
         
         # Create config.yaml
         config_path = self.base_path / 'config.yaml'
-        with open(config_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False, indent=2)
+        # Write a new file and swap it in so a hardlinked backup keeps the old content
+        tmp_path = config_path.with_name(config_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            yaml.dump(self.config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+        tmp_path.replace(config_path)
         click.echo(f"✅ Created: {config_path}")
         
         # Auto-discover validators if enabled
@@ -12,6 +12,8 @@ import logging
 import csv
 import requests
 import json
+import os
+import shutil
 import subprocess
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -21,6 +23,13 @@ from .config import get_all_node_configs
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it parses the keymanager/keystore payloads noticeably faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 def _run_command(node_cfg, command):
     """Run a command on a node, handling both local and remote execution"""
     is_local = node_cfg.get('is_local', False)
@@ -379,11 +388,12 @@ class ValidatorAutoDiscovery:
                 
                 if result.returncode == 0 and result.stdout.strip():
                     try:
-                        keystore_data = json.loads(result.stdout)
+                        keystore_data = _json_loads(result.stdout)
                         # Look for pubkey in keystore
                         if 'pubkey' in keystore_data:
                             return f"0x{keystore_data['pubkey']}"
-                    except json.JSONDecodeError:
+                    except ValueError:
+                        # json.JSONDecodeError and orjson.JSONDecodeError both derive from ValueError
                         pass
         
         except Exception as e:
@@ -437,7 +447,7 @@ class ValidatorAutoDiscovery:
                     
                     result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=15)
                     if result.returncode == 0 and result.stdout.strip():
-                        response_data = json.loads(result.stdout)
+                        response_data = _json_loads(result.stdout)
                         if 'data' in response_data:
                             for keystore in response_data['data']:
                                 if 'validating_pubkey' in keystore:
@@ -534,7 +544,7 @@ class ValidatorAutoDiscovery:
             result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=10)
             
             if result.returncode == 0 and result.stdout.strip():
-                keystore_data = json.loads(result.stdout)
+                keystore_data = _json_loads(result.stdout)
                 if 'pubkey' in keystore_data:
                     pubkey = keystore_data['pubkey']
                     if not pubkey.startswith('0x'):
@@ -730,7 +740,9 @@ class ValidatorAutoDiscovery:
         # Write to CSV even if empty
         csv_path = Path(self.config_file_path).parent / output_file
         
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+        # Write a new file and swap it in so a hardlinked backup keeps the old content
+        tmp_path = csv_path.with_name(csv_path.name + '.tmp')
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = ['validator_index', 'public_key', 'node_name', 'protocol', 'status', 'last_updated']
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             
@@ -747,6 +759,7 @@ class ValidatorAutoDiscovery:
                     'status': validator['status'],
                     'last_updated': validator['last_updated']
                 })
+        tmp_path.replace(csv_path)
         
         if validators:
             logger.info(f"Generated CSV with {len(validators)} validators: {csv_path}")
@@ -776,7 +789,11 @@ class ValidatorAutoDiscovery:
             # Create backup
             backup_file = f"{csv_file}.backup_{int(datetime.now().timestamp())}"
             if Path(csv_file).exists():
-                Path(csv_file).rename(backup_file)
+                # Hardlink is a metadata-only backup and leaves the CSV in place
+                try:
+                    os.link(csv_file, backup_file)
+                except OSError:
+                    shutil.copy2(csv_file, backup_file)
                 logger.info(f"Created backup: {backup_file}")
             
             # Write updated CSV
@@ -6,14 +6,15 @@ including adding new validators, editing existing ones, and bulk operations
 """
 
 import csv
-import yaml
 import json
 import time
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Optional
 import click
 from tabulate import tabulate
 import re
+from .config import load_config
 
 def get_config_path():
     """Find config.yaml in current directory first, then in eth_validators directory"""
@@ -32,8 +33,7 @@ class InteractiveValidatorEditor:
         if config_path is None:
             config_path = get_config_path()
         
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
         
         self.csv_path = Path(__file__).parent / 'validators_vs_hardware.csv'
         self.backup_path = Path(__file__).parent / f'validators_vs_hardware_backup_{int(time.time())}.csv'
@@ -626,30 +626,24 @@ def main_menu():
                     click.echo(f"Total validators: {len(validators)}")
                     
                     # Group by protocol
-                    protocols = {}
-                    for v in validators:
-                        protocol = v.get('Protocol', 'Unknown')
-                        protocols[protocol] = protocols.get(protocol, 0) + 1
+                    protocols = Counter(v.get('Protocol', 'Unknown') for v in validators)
                     
                     click.echo(f"\nBy Protocol:")
                     for protocol, count in sorted(protocols.items()):
                         click.echo(f"  {protocol}: {count}")
                     
                     # Group by node
-                    nodes = {}
-                    for v in validators:
-                        node = v.get('tailscale dns', 'Unknown').split('.')[0] if '.' in v.get('tailscale dns', '') else v.get('tailscale dns', 'Unknown')
-                        nodes[node] = nodes.get(node, 0) + 1
+                    nodes = Counter(
+                        v.get('tailscale dns', 'Unknown').split('.')[0] if '.' in v.get('tailscale dns', '') else v.get('tailscale dns', 'Unknown')
+                        for v in validators
+                    )
                     
                     click.echo(f"\nBy Node:")
                     for node, count in sorted(nodes.items()):
                         click.echo(f"  {node}: {count}")
                     
                     # Group by status
-                    statuses = {}
-                    for v in validators:
-                        status = v.get('current_status', 'unknown')
-                        statuses[status] = statuses.get(status, 0) + 1
+                    statuses = Counter(v.get('current_status', 'unknown') for v in validators)
                     
                     click.echo(f"\nBy Status:")
                     for status, count in sorted(statuses.items()):
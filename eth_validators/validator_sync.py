@@ -8,11 +8,11 @@ and filters out exited validators from analysis
 import requests
 import csv
 import json
-import yaml
 import time
 from pathlib import Path
 from typing import List, Dict, Set, Tuple
 import click
+from .config import load_config
 
 def get_config_path():
     """Find config.yaml in current directory first, then in eth_validators directory"""
@@ -31,8 +31,7 @@ class ValidatorSyncManager:
         if config_path is None:
             config_path = get_config_path()
         
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config(config_path)
         
         self.csv_path = Path(__file__).parent / 'validators_vs_hardware.csv'
         self.backup_path = Path(__file__).parent / f'validators_vs_hardware_backup_{int(time.time())}.csv'